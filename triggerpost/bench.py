@@ -0,0 +1,213 @@
+# bench.py  —  Offline-Benchmarks der TriggerPost-Hot-Paths gegen synthetische Guilds
+#
+#   python -m triggerpost.bench                       (Standardgrößen 100 … 50000)
+#   python -m triggerpost.bench --sizes 1000,5000 --iterations 200 --triggers 100
+#
+# Läuft ohne Discord-Verbindung: der Cog wird ohne Config/Views aufgebaut (_init_state)
+# und bekommt Fake-Guilds aus fakes.py.
+import argparse
+import asyncio
+import copy
+import inspect
+import json
+import random
+import statistics
+import time
+from typing import Callable, Optional
+
+import discord
+
+from .fakes import build_guild
+from .triggerpost import DEFAULT_GUILD, ROLE_NORMAL, TriggerPost, _sort_key
+
+DEFAULT_SIZES = (100, 1_000, 5_000, 20_000, 50_000)
+
+SAMPLE_MESSAGES = (
+    "hey leute, kann mir jemand bei jigwi helfen?",
+    "ich brauche hilfe beim knaben in blau, schwer modus",
+    "guten abend zusammen",
+    "wer hat lust auf bulgasal? normal reicht",
+    "lol",
+    "suche gruppe für uturi + dunkler bonghwang, hilfe wäre nice",
+)
+
+
+class _BenchBot:
+    user = None
+    guilds: list = []
+
+    def get_guild(self, _guild_id):
+        return None
+
+
+def make_cog() -> TriggerPost:
+    cog = TriggerPost.__new__(TriggerPost)
+    cog._init_state(_BenchBot())
+    return cog
+
+
+def _triggers(n: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    words = ["hilfe", "muhhelfer", "boss", "jigwi", "bulgasal", "uturi", "schwer", "normal", "carry", "gruppe"]
+    out = ["hilfe"]
+    while len(out) < n:
+        if rng.random() < 0.3:
+            t = f"{rng.choice(words)}+{rng.choice(words)}{rng.randrange(100)}"
+        else:
+            t = f"{rng.choice(words)}{rng.randrange(10_000)}"
+        if t not in out:
+            out.append(t)
+    return out
+
+
+def _legacy_match(triggers: list[str], content: str) -> bool:
+    """Die frühere Schleife aus on_message – als Vergleichswert."""
+    for trigger in triggers:
+        if "+" in trigger:
+            parts = [p.strip() for p in trigger.split("+") if p.strip()]
+            if parts and all(p in content for p in parts):
+                return True
+        elif trigger in content:
+            return True
+    return False
+
+
+class Result:
+    def __init__(self, name: str, size: int, samples: list[float]):
+        self.name = name
+        self.size = size
+        self.samples = samples
+
+    @property
+    def p50(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p99(self) -> float:
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(round(0.99 * (len(ordered) - 1))))]
+
+    @property
+    def ops(self) -> float:
+        total = sum(self.samples)
+        return len(self.samples) / total if total else float("inf")
+
+    def row(self) -> str:
+        return f"{self.name:<34} {self.size:>7} {self.ops:>12.1f} {self.p50 * 1e6:>11.1f} {self.p99 * 1e6:>11.1f}"
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "size": self.size, "ops_per_s": self.ops, "p50_us": self.p50 * 1e6, "p99_us": self.p99 * 1e6}
+
+
+async def _measure(name: str, size: int, iterations: int, fn: Callable[[], object],
+                   setup: Optional[Callable[[], None]] = None) -> Result:
+    samples = []
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        res = fn()
+        if inspect.isawaitable(res):
+            await res
+        samples.append(time.perf_counter() - start)
+    return Result(name, size, samples)
+
+
+async def run(sizes, iterations: int, trigger_count: int, seed: int) -> list[Result]:
+    results: list[Result] = []
+    for size in sizes:
+        guild = build_guild(size, seed=seed)
+        cog = make_cog()
+        author = next(iter(guild.members), None)
+        its = max(5, iterations if size <= 5_000 else iterations // 5)
+
+        def cold():
+            cog._rosters.clear()
+            cog._render_cache.clear()
+            cog._role_lines.clear()
+            cog._member_lines.clear()
+
+        def drop_render():
+            cog._render_cache.clear()
+            cog._role_lines.clear()
+
+        results.append(await _measure("online_members (cold)", size, its,
+                                      lambda: cog._online_members(guild, ROLE_NORMAL), cold))
+        cog._online_members(guild, ROLE_NORMAL)
+        results.append(await _measure("online_members (warm)", size, its,
+                                      lambda: cog._online_members(guild, ROLE_NORMAL)))
+
+        online = list(cog._roster(guild).online[ROLE_NORMAL].values())
+        results.append(await _measure("sort(_sort_key)", size, its, lambda: sorted(online, key=_sort_key)))
+
+        # ein Statuswechsel (online <-> idle) + neu gelesene Liste: bisect statt Vollsortierung
+        index = cog._roster(guild)
+        mover = online[len(online) // 2] if online else None
+
+        def presence_change():
+            mover.status = discord.Status.idle if mover.status is discord.Status.online else discord.Status.online
+            index.update_member(mover)
+            index.members(ROLE_NORMAL)
+
+        if mover is not None:
+            results.append(await _measure("roster update + members", size, its, presence_change))
+        results.append(await _measure("roster_digest (cold)", size, its,
+                                      lambda: cog._roster_digest(guild), cold))
+        results.append(await _measure("roster_digest (warm)", size, its,
+                                      lambda: cog._roster_digest(guild)))
+
+        renderers = (
+            ("embed_main", lambda: cog._embed_main(guild, author)),
+            ("embed_columns", lambda: cog._embed_columns(guild, author)),
+            ("embed_dashboard[overview]", lambda: cog._embed_dashboard(guild, "overview")),
+            ("embed_dashboard[normal]", lambda: cog._embed_dashboard(guild, "normal")),
+            ("embed_dashboard[schwer]", lambda: cog._embed_dashboard(guild, "schwer")),
+        )
+        cog._roster(guild)
+        for name, fn in renderers:
+            results.append(await _measure(f"{name} (render)", size, its, fn, drop_render))
+            results.append(await _measure(f"{name} (cached)", size, its, fn))
+
+        # Trigger-Matching: Größe = Anzahl Trigger, unabhängig von der Roster-Größe
+        if size == sizes[0]:
+            triggers = _triggers(trigger_count, seed)
+            cog._conf_cache[guild.id] = copy.deepcopy(DEFAULT_GUILD)
+            cog._conf_cache[guild.id]["triggers"] = triggers
+            msgs = [m.casefold() for m in SAMPLE_MESSAGES]
+            matcher = cog._matcher_for(guild.id)
+
+            def match_compiled():
+                for m in msgs:
+                    matcher.matches(m)
+
+            def match_legacy():
+                for m in msgs:
+                    _legacy_match(triggers, m)
+
+            results.append(await _measure("trigger_match (matcher)", trigger_count, iterations, match_compiled))
+            results.append(await _measure("trigger_match (legacy loop)", trigger_count, iterations, match_legacy))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TriggerPost Hot-Path-Benchmarks (offline)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Anzahl Rolleninhaber, kommagetrennt (Standard: %(default)s)")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--triggers", type=int, default=50, help="Anzahl Trigger für das Matching")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Ergebnisse als JSON ausgeben")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = asyncio.run(run(sizes, args.iterations, args.triggers, args.seed))
+    if args.json:
+        print(json.dumps([r.as_dict() for r in results], indent=2))
+        return
+    print(f"{'benchmark':<34} {'size':>7} {'ops/s':>12} {'p50 (µs)':>11} {'p99 (µs)':>11}")
+    for r in results:
+        print(r.row())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# churn.py  —  Roster-Änderungsrate als exponentiell abklingender Mittelwert (für adaptives Intervall)
+import math
+import time
+from typing import Callable
+
+CHURN_TAU = 120.0  # Sekunden; so schnell "vergisst" die Rate alte Änderungen
+
+
+class ChurnRate:
+    """EWMA der Änderungen pro Sekunde mit Zeitkonstante `tau`.
+
+    Jede Änderung erhöht die Rate um 1/tau, dazwischen klingt sie mit exp(-dt/tau) ab. Bei
+    gleichmäßig r Änderungen/s pendelt sich der Wert also auf r ein, ohne Zeitfenster oder Ringpuffer.
+    """
+
+    __slots__ = ("tau", "_clock", "_rate", "_at")
+
+    def __init__(self, tau: float = CHURN_TAU, clock: Callable[[], float] = time.monotonic):
+        self.tau = tau
+        self._clock = clock
+        self._rate = 0.0
+        self._at = clock()
+
+    def _decay(self, now: float):
+        dt = now - self._at
+        if dt > 0:
+            self._rate *= math.exp(-dt / self.tau)
+            self._at = now
+
+    def hit(self, n: int = 1):
+        self._decay(self._clock())
+        self._rate += n / self.tau
+
+    def rate(self) -> float:
+        """Aktuelle Rate in Änderungen pro Sekunde."""
+        self._decay(self._clock())
+        return self._rate
+
+
+def adaptive_interval(rate: float, low: int, high: int, changes_per_edit: float = 1.0) -> int:
+    """Intervall, in dem im Mittel `changes_per_edit` Änderungen anfallen – begrenzt auf [low, high]."""
+    if rate <= 0:
+        return high
+    return int(min(high, max(low, changes_per_edit / rate)))
@@ -0,0 +1,76 @@
+# coalescer.py  —  Edit-Warteschlange pro Nachricht: ausstehende Edits verschmelzen, Abstand einhalten
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+EDIT_MIN_INTERVAL = 1.2  # Sekunden zwischen zwei PATCHes auf dieselbe Nachricht
+
+
+class _Slot:
+    __slots__ = ("target", "payload", "waiters", "last", "task")
+
+    def __init__(self):
+        self.target: Any = None
+        self.payload: Optional[dict] = None
+        self.waiters: list[asyncio.Future] = []
+        self.last = float("-inf")
+        self.task: Optional[asyncio.Task] = None
+
+
+class EditCoalescer:
+    """Höchstens ein laufender Edit pro Nachricht. Was währenddessen oder in der Abstandszeit
+    eintrifft, wird zu EINEM Edit mit dem neuesten Stand zusammengefasst; alle Aufrufer
+    bekommen das Ergebnis dieses Edits."""
+
+    def __init__(
+        self,
+        min_interval: float = EDIT_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        on_rest: Optional[Callable[[str], None]] = None,
+    ):
+        self.min_interval = min_interval
+        self._clock = clock
+        self._on_rest = on_rest
+        self._slots: dict[int, _Slot] = {}
+
+    async def submit(self, message, **payload):
+        """message: Message oder PartialMessage; payload wie bei message.edit()."""
+        slot = self._slots.get(message.id)
+        if slot is None:
+            slot = self._slots[message.id] = _Slot()
+        slot.target = message
+        slot.payload = {**slot.payload, **payload} if slot.payload else dict(payload)
+        fut = asyncio.get_running_loop().create_future()
+        slot.waiters.append(fut)
+        if slot.task is None:
+            slot.task = asyncio.create_task(self._run(message.id, slot))
+        return await fut
+
+    async def _run(self, message_id: int, slot: _Slot):
+        try:
+            while slot.payload is not None:
+                wait = slot.last + self.min_interval - self._clock()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                payload, waiters = slot.payload, slot.waiters
+                slot.payload, slot.waiters = None, []
+                if self._on_rest:
+                    self._on_rest("edit")
+                try:
+                    result = await slot.target.edit(**payload)
+                except Exception as e:
+                    for fut in waiters:
+                        if not fut.done():
+                            fut.set_exception(e)
+                else:
+                    for fut in waiters:
+                        if not fut.done():
+                            fut.set_result(result)
+                slot.last = self._clock()
+                # Abstandszeit im Slot abwarten, damit Nachzügler gebündelt werden
+                await asyncio.sleep(self.min_interval)
+        finally:
+            for fut in slot.waiters:
+                if not fut.done():
+                    fut.cancel()
+            self._slots.pop(message_id, None)
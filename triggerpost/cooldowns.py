@@ -0,0 +1,42 @@
+# cooldowns.py  —  Cooldown-Speicher mit Ablauf (monotonic), Speicher bleibt begrenzt
+import heapq
+import itertools
+import time
+from typing import Callable, Hashable
+
+
+class CooldownStore:
+    """Cooldowns für beliebige hashbare Keys; TriggerPost nutzt ("ping", channel_id) und ("post", channel_id).
+
+    `hit()` ist Prüfen-und-Setzen in einem Aufruf. Abgelaufene Einträge werden über einen
+    Ablauf-Heap bei jedem Zugriff mit weggeräumt, es bleiben also nur aktive Cooldowns im Speicher.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._until: dict[Hashable, float] = {}
+        self._expiry: list[tuple[float, int, Hashable]] = []
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._until)
+
+    def _prune(self, now: float):
+        heap, until = self._expiry, self._until
+        while heap and heap[0][0] <= now:
+            when, _seq, key = heapq.heappop(heap)
+            if until.get(key) == when:
+                del until[key]
+
+    def hit(self, key: Hashable, seconds: float) -> float:
+        """0.0, wenn kein Cooldown lief (der neue ist dann gesetzt), sonst die Restzeit in Sekunden."""
+        now = self._clock()
+        self._prune(now)
+        until = self._until.get(key)
+        if until is not None:
+            return until - now
+        if seconds > 0:
+            until = now + seconds
+            self._until[key] = until
+            heapq.heappush(self._expiry, (until, next(self._seq), key))
+        return 0.0
@@ -0,0 +1,215 @@
+# fakes.py  —  Offline-Stand-ins für Guild/Role/Member/Channel (Benchmarks & Replay, keine Discord-Verbindung)
+import itertools
+import random
+from collections import Counter
+from typing import Iterable, Optional
+
+import discord
+
+from .triggerpost import ROLE_NORMAL, ROLE_SCHWER
+
+STATUS_WEIGHTS = (
+    (discord.Status.online, 0.35),
+    (discord.Status.idle, 0.15),
+    (discord.Status.dnd, 0.10),
+    (discord.Status.offline, 0.40),
+)
+
+
+class FakeVoiceState:
+    __slots__ = ("channel",)
+
+    def __init__(self, channel_id: int):
+        self.channel = discord.Object(id=channel_id)
+
+
+class FakeRole:
+    def __init__(self, guild: "FakeGuild", role_id: int, name: str, position: int = 1):
+        self.guild = guild
+        self.id = role_id
+        self.name = name
+        self.position = position
+        self.mentionable = False
+        self._members: dict[int, "FakeMember"] = {}
+
+    @property
+    def mention(self) -> str:
+        return f"<@&{self.id}>"
+
+    @property
+    def members(self) -> list["FakeMember"]:
+        return list(self._members.values())
+
+
+class FakeMember:
+    def __init__(self, guild: "FakeGuild", member_id: int, name: str, status=discord.Status.offline):
+        self.guild = guild
+        self.id = member_id
+        self.bot = False
+        self.name = name
+        self.nick: Optional[str] = None
+        self.status = status
+        self.voice: Optional[FakeVoiceState] = None
+        self.guild_permissions = discord.Permissions.none()
+        self.top_role: Optional[FakeRole] = None
+        self._roles: dict[int, FakeRole] = {}
+
+    @property
+    def display_name(self) -> str:
+        return self.nick or self.name
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    @property
+    def roles(self) -> list[FakeRole]:
+        return list(self._roles.values())
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+        return self._roles.get(role_id)
+
+    def add_role(self, role: FakeRole):
+        self._roles[role.id] = role
+        role._members[self.id] = self
+
+    def remove_role(self, role: FakeRole):
+        self._roles.pop(role.id, None)
+        role._members.pop(self.id, None)
+
+
+class _FakeResponse:
+    status = 404
+    reason = "Not Found"
+
+
+class FakeMessage:
+    def __init__(self, channel: "FakeChannel", message_id: int, *, content: str = "", embed=None, author=None):
+        self.channel = channel
+        self.guild = channel.guild
+        self.id = message_id
+        self.content = content
+        self.embeds = [embed] if embed is not None else []
+        self.author = author
+
+    async def edit(self, **payload):
+        channel = self.channel
+        channel.calls["edit"] += 1
+        stored = channel.messages.get(self.id)
+        if stored is None:
+            raise discord.NotFound(_FakeResponse(), "Unknown Message")
+        if "content" in payload:
+            stored.content = payload["content"]
+        if "embed" in payload:
+            stored.embeds = [payload["embed"]]
+        return stored
+
+    async def delete(self, *, delay: Optional[float] = None):
+        self.channel.calls["delete"] += 1
+        if self.channel.messages.pop(self.id, None) is None:
+            raise discord.NotFound(_FakeResponse(), "Unknown Message")
+
+
+class FakeChannel:
+    """Textchannel, der Nachrichten im Speicher hält und jeden "REST-Aufruf" in `calls` zählt."""
+
+    def __init__(self, guild: "FakeGuild", channel_id: int):
+        self.guild = guild
+        self.id = channel_id
+        self.messages: dict[int, FakeMessage] = {}
+        self.calls: Counter = Counter()
+        # echte Snowflakes (jung genug für Bulk-Delete)
+        self._ids = itertools.count(discord.utils.time_snowflake(discord.utils.utcnow()))
+
+    @property
+    def mention(self) -> str:
+        return f"<#{self.id}>"
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        return self.messages.get(message_id) or FakeMessage(self, message_id)
+
+    def permissions_for(self, _member) -> discord.Permissions:
+        return discord.Permissions(manage_messages=True, send_messages=True)
+
+    async def send(self, content: Optional[str] = None, *, embed=None, view=None, allowed_mentions=None) -> FakeMessage:
+        self.calls["send"] += 1
+        message = FakeMessage(self, next(self._ids), content=content or "", embed=embed, author=self.guild.me)
+        self.messages[message.id] = message
+        return message
+
+    async def delete_messages(self, messages):
+        self.calls["bulk_delete"] += 1
+        for obj in messages:
+            self.messages.pop(obj.id, None)
+
+    async def history(self, limit: Optional[int] = 100):
+        self.calls["history"] += 1
+        for message_id in sorted(self.messages, reverse=True)[:limit]:
+            yield self.messages[message_id]
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int = 1):
+        self.id = guild_id
+        self.chunked = True
+        self.me = None
+        self._members: dict[int, FakeMember] = {}
+        self._roles: dict[int, FakeRole] = {
+            ROLE_NORMAL: FakeRole(self, ROLE_NORMAL, "Muhhelfer – Normal"),
+            ROLE_SCHWER: FakeRole(self, ROLE_SCHWER, "Muhhelfer – Schwer"),
+        }
+        self._channels: dict[int, object] = {}
+
+    @property
+    def members(self) -> list[FakeMember]:
+        return list(self._members.values())
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+        return self._roles.get(role_id)
+
+    def get_member(self, member_id: int) -> Optional[FakeMember]:
+        return self._members.get(member_id)
+
+    def get_channel(self, channel_id: int):
+        return self._channels.get(channel_id)
+
+    def add_member(self, member_id: int, name: str, status=discord.Status.offline) -> FakeMember:
+        member = self._members[member_id] = FakeMember(self, member_id, name, status)
+        return member
+
+    def remove_member(self, member_id: int) -> Optional[FakeMember]:
+        member = self._members.pop(member_id, None)
+        if member is not None:
+            for role in member.roles:
+                member.remove_role(role)
+        return member
+
+    def add_channel(self, channel_id: int) -> FakeChannel:
+        channel = self._channels[channel_id] = FakeChannel(self, channel_id)
+        return channel
+
+
+def build_guild(
+    role_holders: int,
+    *,
+    seed: int = 0,
+    schwer_ratio: float = 0.35,
+    voice_ratio: float = 0.15,
+    guild_id: int = 1,
+    statuses: Iterable = STATUS_WEIGHTS,
+) -> FakeGuild:
+    """Guild mit `role_holders` Muhhelfern (Normal, ein Teil zusätzlich Schwer), gemischten
+    Status und Voice-Zuständen. Gleicher Seed → gleiche Guild."""
+    rng = random.Random(seed)
+    states, weights = zip(*statuses)
+    guild = FakeGuild(guild_id)
+    normal, schwer = guild.get_role(ROLE_NORMAL), guild.get_role(ROLE_SCHWER)
+    for i in range(role_holders):
+        status = rng.choices(states, weights)[0]
+        member = guild.add_member(10_000_000 + i, f"muhhelfer{rng.randrange(10 ** 6):06d}", status)
+        member.add_role(normal)
+        if rng.random() < schwer_ratio:
+            member.add_role(schwer)
+        if status is not discord.Status.offline and rng.random() < voice_ratio:
+            member.voice = FakeVoiceState(900 + rng.randrange(5))
+    return guild
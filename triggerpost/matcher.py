@@ -0,0 +1,106 @@
+# matcher.py  —  Kompilierter Trigger-Matcher (Aho-Corasick + UND-Gruppen für "a+b"-Trigger)
+from typing import Iterable, Optional
+
+
+class TriggerMatcher:
+    """Prüft alle Trigger einer Guild in EINEM Durchlauf über den (casefolded) Nachrichtentext.
+
+    - Einfacher Trigger  "hilfe"       → Treffer, sobald der Teilstring vorkommt.
+    - Kombi-Trigger      "boss+hilfe"  → Treffer, sobald ALLE Teile vorkommen (Reihenfolge egal).
+    """
+
+    __slots__ = ("source", "_goto", "_fail", "_out", "_simple", "_groups", "_needle_groups", "_match_all")
+
+    def __init__(self, triggers: Iterable[str]):
+        self.source: tuple[str, ...] = tuple(triggers)
+        needles: dict[str, int] = {}
+        simple: set[int] = set()
+        groups: list[int] = []                    # Gruppe -> Anzahl verschiedener Teile
+        needle_groups: dict[int, list[int]] = {}  # Needle -> Gruppen, in denen sie vorkommt
+        match_all = False
+
+        def needle_id(text: str) -> int:
+            if text not in needles:
+                needles[text] = len(needles)
+            return needles[text]
+
+        for trigger in self.source:
+            if "+" in trigger:
+                parts = {p.strip() for p in trigger.split("+") if p.strip()}
+                if not parts:
+                    continue
+                gid = len(groups)
+                groups.append(len(parts))
+                for p in parts:
+                    needle_groups.setdefault(needle_id(p), []).append(gid)
+            elif trigger == "":
+                match_all = True  # "" in content ist immer wahr
+            else:
+                simple.add(needle_id(trigger))
+
+        self._simple = frozenset(simple)
+        self._groups = groups
+        self._needle_groups = needle_groups
+        self._match_all = match_all
+        self._build(needles)
+
+    def _build(self, needles: dict[str, int]):
+        goto: list[dict[str, int]] = [{}]
+        out: list[tuple[int, ...]] = [()]
+        for text, nid in needles.items():
+            state = 0
+            for ch in text:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = out[state] + (nid,)
+
+        # Fail-Links per BFS; Ausgaben der Fail-Kette werden direkt mitgeführt
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                cand = goto[f].get(ch, 0)
+                fail[nxt] = cand if cand != nxt else 0
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def matches(self, content: str) -> bool:
+        """content muss bereits casefolded sein."""
+        if self._match_all:
+            return True
+        if not (self._simple or self._groups):
+            return False
+        goto, fail, out = self._goto, self._fail, self._out
+        simple, groups, needle_groups = self._simple, self._groups, self._needle_groups
+        seen: set[int] = set()
+        hits: Optional[list[int]] = None
+        state = 0
+        for ch in content:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for nid in out[state]:
+                if nid in seen:
+                    continue
+                seen.add(nid)
+                if nid in simple:
+                    return True
+                for gid in needle_groups.get(nid, ()):
+                    if hits is None:
+                        hits = [0] * len(groups)
+                    hits[gid] += 1
+                    if hits[gid] == groups[gid]:
+                        return True
+        return False
@@ -0,0 +1,168 @@
+# metrics.py  —  Latenz-Histogramme, Zähler und Gauges für °muhhelfer stats (+ Prometheus-Textformat)
+import bisect
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+# Obergrenzen der Histogramm-Buckets in Sekunden (wie Prometheus-Default, nach unten erweitert)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_current_op: contextvars.ContextVar[str] = contextvars.ContextVar("triggerpost_op", default="other")
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)  # letzter Bucket = +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Schätzung per linearer Interpolation innerhalb des Buckets."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = LATENCY_BUCKETS[i - 1] if i > 0 else 0.0
+                upper = LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / n, self.max)
+            seen += n
+        return self.max
+
+
+def _labels_str(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+class Metrics:
+    """Prozesslokale Messwerte. Zähler und Histogramme können Labels tragen (z. B. op, kind)."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.counters: dict[tuple[str, tuple], int] = {}
+        self.histograms: dict[tuple[str, tuple], Histogram] = {}
+        self.gauges: dict[tuple[str, tuple], float] = {}
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple[str, tuple]:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name: str, n: int = 1, **labels):
+        key = self._key(name, labels)
+        self.counters[key] = self.counters.get(key, 0) + n
+
+    def observe(self, name: str, value: float, **labels):
+        key = self._key(name, labels)
+        hist = self.histograms.get(key)
+        if hist is None:
+            hist = self.histograms[key] = Histogram()
+        hist.observe(value)
+
+    def set_gauge(self, name: str, value: float, **labels):
+        self.gauges[self._key(name, labels)] = value
+
+    def rest(self, kind: str, n: int = 1):
+        """REST-Aufruf zählen; die laufende Operation (siehe timer) wird als Label mitgeschrieben."""
+        self.inc("rest_calls_total", n, op=_current_op.get(), kind=kind)
+
+    @contextmanager
+    def timer(self, op: str):
+        token = _current_op.set(op)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("op_latency_seconds", time.perf_counter() - start, op=op)
+            _current_op.reset(token)
+
+    def counter_total(self, name: str) -> int:
+        return sum(v for (n, _l), v in self.counters.items() if n == name)
+
+    def summary_lines(self) -> list[str]:
+        lines = [f"Laufzeit: {int(time.time() - self.started)}s", "", "Latenz (p50 / p99 / max, ms, Anzahl):"]
+        for (name, labels), hist in sorted(self.histograms.items()):
+            label = ",".join(v for _k, v in labels) or name
+            lines.append(
+                f"  {label:<22} {hist.quantile(0.5) * 1000:8.2f} {hist.quantile(0.99) * 1000:8.2f} "
+                f"{hist.max * 1000:8.2f}  n={hist.count}"
+            )
+        lines += ["", "Zähler:"]
+        for (name, labels), value in sorted(self.counters.items()):
+            lines.append(f"  {name}{_labels_str(labels)} = {value}")
+        if self.gauges:
+            lines += ["", "Gauges:"]
+            for (name, labels), value in sorted(self.gauges.items()):
+                lines.append(f"  {name}{_labels_str(labels)} = {value:.4f}")
+        return lines
+
+    def prometheus(self, prefix: str = "triggerpost") -> str:
+        out: list[str] = []
+        typed: set[str] = set()
+
+        def head(metric: str, kind: str):
+            if metric not in typed:
+                typed.add(metric)
+                out.append(f"# TYPE {metric} {kind}")
+
+        for (name, labels), value in sorted(self.counters.items()):
+            metric = f"{prefix}_{name}"
+            head(metric, "counter")
+            out.append(f"{metric}{_labels_str(labels)} {value}")
+        for (name, labels), value in sorted(self.gauges.items()):
+            metric = f"{prefix}_{name}"
+            head(metric, "gauge")
+            out.append(f"{metric}{_labels_str(labels)} {value}")
+        for (name, labels), hist in sorted(self.histograms.items()):
+            metric = f"{prefix}_{name}"
+            head(metric, "histogram")
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS + (float("inf"),), hist.counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                out.append(f"{metric}_bucket{_labels_str(labels + (('le', le),))} {cumulative}")
+            out.append(f"{metric}_sum{_labels_str(labels)} {hist.sum}")
+            out.append(f"{metric}_count{_labels_str(labels)} {hist.count}")
+        return "\n".join(out) + "\n"
+
+
+class RateLimitCounter(logging.Handler):
+    """Zählt die 429-Warnungen, die discord.py beim automatischen Retry loggt. Der Logger ist
+    prozessweit (alle Cogs), daher eigene Metrik statt http_429_total (nur TriggerPost-Requests)."""
+
+    def __init__(self, metrics: Metrics):
+        super().__init__(level=logging.WARNING)
+        self.metrics = metrics
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = record.getMessage()
+        except Exception:
+            return
+        if "429" in msg or "rate limit" in msg.lower():
+            self.metrics.inc("http_429_logged_total", source="discord.http")
+
+
+def attach_rate_limit_counter(metrics: Metrics) -> RateLimitCounter:
+    handler = RateLimitCounter(metrics)
+    logging.getLogger("discord.http").addHandler(handler)
+    return handler
+
+
+def detach_rate_limit_counter(handler: Optional[RateLimitCounter]):
+    if handler is not None:
+        logging.getLogger("discord.http").removeHandler(handler)
@@ -0,0 +1,53 @@
+# paging.py  —  Roster-Zeilen größenbewusst auf Blöcke/Seiten verteilen (Discord-Embed-Limits)
+import re
+from typing import Optional, Sequence
+
+FIELD_LIMIT = 1024         # Discord: Feldwert
+MAIN_SECTION_LIMIT = 1950  # Übersicht: zwei Abschnitte teilen sich die 4096 der Beschreibung
+DASH_FIELDS_PER_PAGE = 4   # Dashboard-Tab: bis zu 4 volle Felder pro Seite (< 6000 pro Embed)
+EMPTY = "– aktuell niemand –"
+
+_PAGE_RE = re.compile(r"^Seite (\d+)/(\d+) • ")  # immer Präfix des Footers (siehe _footer)
+
+
+def _units(text: str) -> int:
+    """Länge wie Discord sie zählt (UTF-16-Einheiten, Emojis zählen also ggf. doppelt)."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def chunk_lines(lines: Sequence[str], limit: int) -> list[str]:
+    """Zeilen in EINEM Durchlauf zu Blöcken zusammenfassen, deren "\\n"-Join `limit` nicht
+    überschreitet. Leere Liste → ein Block mit EMPTY."""
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for line in lines:
+        n = _units(line)
+        if n > limit:
+            line, n = line[: limit - 1] + "…", limit
+        if current and size + 1 + n > limit:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        size += n + (1 if current else 0)
+        current.append(line)
+    if current:
+        chunks.append("\n".join(current))
+    return chunks or [EMPTY]
+
+
+def page_label(page: int, pages: int) -> str:
+    return f"Seite {page}/{pages}" if pages > 1 else ""
+
+
+def page_of(message) -> tuple[int, int]:
+    """(Seite, Seitenzahl) aus dem Footer der Nachricht; ohne Angabe (1, 1)."""
+    if message and message.embeds:
+        footer: Optional[str] = message.embeds[0].footer.text
+        match = _PAGE_RE.match(footer or "")
+        if match:
+            return int(match.group(1)), int(match.group(2))
+    return 1, 1
+
+
+def clamp(page: int, pages: int) -> int:
+    return min(max(page, 1), max(pages, 1))
@@ -0,0 +1,117 @@
+# pings.py  —  Rollen-Pings bündeln: ein Mentionable-Toggle pro Burst, eine Nachricht pro Rolle & Channel
+import asyncio
+from typing import Callable, Optional
+
+import discord
+from discord import AllowedMentions
+
+PING_BATCH_WINDOW = 1.5  # Sekunden sammeln, bevor gesendet wird
+
+_MENTIONS = AllowedMentions(roles=True, users=True, everyone=False)
+
+
+class _Burst:
+    __slots__ = ("role", "requests", "task")
+
+    def __init__(self, role: discord.Role):
+        self.role = role
+        self.requests: list[tuple[object, str, bool, asyncio.Future]] = []
+        self.task: Optional[asyncio.Task] = None
+
+
+class RolePingBatcher:
+    """Pings derselben Rolle innerhalb von PING_BATCH_WINDOW teilen sich einen
+    `role.edit(mentionable=True/False)`-Zyklus und werden pro Channel zu einer Nachricht
+    zusammengefasst.
+
+    Solange die Rolle erwähnbar ist, kann JEDES Mitglied sie überall in der Guild erwähnen.
+    Getoggelt wird deshalb erst nach dem Sammelfenster, und zurückgesetzt, sobald nach einem
+    Senden nichts mehr in der Warteschlange liegt. Offen ist die Rolle also nur für die Dauer
+    der Sends (Pings, die währenddessen eintreffen, gehen ohne neues Fenster direkt mit raus)."""
+
+    def __init__(
+        self,
+        window: float = PING_BATCH_WINDOW,
+        on_rest: Optional[Callable[[str], None]] = None,
+    ):
+        self.window = window
+        self._on_rest = on_rest or (lambda kind: None)
+        self._bursts: dict[int, _Burst] = {}
+        self._tails: dict[int, asyncio.Task] = {}  # letzter Worker pro Rolle (Revert abwarten)
+
+    async def request(self, channel, role: discord.Role, requester_mention: str, *, force: bool) -> discord.Message:
+        burst = self._bursts.get(role.id)
+        if burst is None:
+            burst = self._bursts[role.id] = _Burst(role)
+            burst.task = asyncio.create_task(self._run(burst, self._tails.get(role.id)))
+            self._tails[role.id] = burst.task
+        fut = asyncio.get_running_loop().create_future()
+        burst.requests.append((channel, requester_mention, force, fut))
+        return await fut
+
+    def close(self):
+        for burst in list(self._bursts.values()):
+            if burst.task:
+                burst.task.cancel()
+
+    @staticmethod
+    def _needs_toggle(channel, role: discord.Role) -> bool:
+        me: discord.Member = channel.guild.me  # type: ignore
+        perms = channel.permissions_for(me)
+        if perms.mention_everyone or role.mentionable:
+            return False
+        return perms.manage_roles and (role.position < (me.top_role.position if me.top_role else 0))
+
+    async def _run(self, burst: _Burst, previous: Optional[asyncio.Task]):
+        role = burst.role
+        toggled = False
+        try:
+            if previous and not previous.done():
+                await asyncio.wait([previous])  # Revert des vorherigen Bursts nicht überholen
+            await asyncio.sleep(self.window)
+            while True:
+                batch, burst.requests = burst.requests, []
+                if any(force for _c, _m, force, _f in batch) and not toggled:
+                    if any(self._needs_toggle(c, role) for c, _m, force, _f in batch if force):
+                        self._on_rest("role_edit")
+                        try:
+                            await role.edit(mentionable=True, reason="Force role ping (temporary)")
+                            toggled = True
+                        except discord.HTTPException:
+                            pass
+
+                by_channel: dict[int, tuple[object, list[str], list[asyncio.Future]]] = {}
+                for channel, mention, _force, fut in batch:
+                    entry = by_channel.setdefault(channel.id, (channel, [], []))
+                    if mention not in entry[1]:
+                        entry[1].append(mention)
+                    entry[2].append(fut)
+                for channel, mentions, futs in by_channel.values():
+                    content = f"🔔 {role.mention} – angefragt von {', '.join(mentions)}"
+                    self._on_rest("send")
+                    try:
+                        msg = await channel.send(content, allowed_mentions=_MENTIONS)
+                    except Exception as e:
+                        for fut in futs:
+                            if not fut.done():
+                                fut.set_exception(e)
+                    else:
+                        for fut in futs:
+                            if not fut.done():
+                                fut.set_result(msg)
+
+                if not burst.requests:
+                    break  # Warteschlange leer → sofort zurücksetzen (finally)
+                # währenddessen eingetroffen: ohne erneutes Fenster direkt hinterher
+        finally:
+            if self._bursts.get(role.id) is burst:
+                del self._bursts[role.id]
+            for _c, _m, _force, fut in burst.requests:
+                if not fut.done():
+                    fut.cancel()
+            if toggled:
+                self._on_rest("role_edit")
+                try:
+                    await role.edit(mentionable=False, reason="Force role ping (revert)")
+                except Exception:
+                    pass
@@ -0,0 +1,109 @@
+# recorder.py  —  Roster-relevante Gateway-Events als kompaktes JSONL mitschreiben (für replay.py)
+#
+# Eine Zeile pro Event, Zeit "t" in Sekunden seit Start:
+#   {"t":0,"e":"init","g":<guild>,"ch":<zielchannel>,"roles":[..],"m":[[id,name,status,voice,[rollen]],..]}
+#   {"t":1.5,"e":"p","m":<id>,"s":"idle"}              Presence (nur Statuswechsel)
+#   {"t":2.0,"e":"v","m":<id>,"v":1}                   Voice betreten (1) / verlassen (0)
+#   {"t":3.1,"e":"u","m":<id>,"n":"name","r":[..]}     Rollen/Anzeigename geändert
+#   {"t":4.2,"e":"x","m":<id>}                         Mitglied hat die Guild verlassen
+#   {"t":5.0,"e":"msg","m":<id>,"n":"name","c":".."}   Nachricht im Zielchannel
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+RECORD_MAX_EVENTS = 1_000_000  # danach wird nicht mehr mitgeschrieben (Platte schonen)
+MESSAGE_MAX_CHARS = 300        # Trigger-Matching braucht nur den Anfang der Nachricht
+
+
+class EventRecorder:
+    """Puffert Events im Speicher; dump()/write() wie beim SnapshotStore, damit das Schreiben
+    per asyncio.to_thread passiert – aus async-Code über save(), das die Schreibvorgänge
+    serialisiert (sonst können sich Snapshot-Loop und `record stop` überholen). Mitglieder ohne Muhhelfer-Rolle werden
+    ignoriert – außer als Autor einer Nachricht im Zielchannel."""
+
+    def __init__(self, path: Path, role_ids: Iterable[int], channel_id: Optional[int],
+                 clock: Callable[[], float] = time.monotonic):
+        self.path = path
+        self.role_ids = tuple(role_ids)
+        self.channel_id = channel_id
+        self.count = 0
+        self.truncated = False
+        self._clock = clock
+        self._t0 = clock()
+        self._buf: list[str] = []
+        self._lock = asyncio.Lock()
+
+    def _tracked(self, member) -> bool:
+        return any(member.get_role(rid) for rid in self.role_ids)
+
+    def _roles_of(self, member) -> list[int]:
+        return [rid for rid in self.role_ids if member.get_role(rid)]
+
+    def _emit(self, event: str, **fields):
+        if self.count >= RECORD_MAX_EVENTS:
+            self.truncated = True
+            return
+        self.count += 1
+        row = {"t": round(self._clock() - self._t0, 3), "e": event, **fields}
+        self._buf.append(json.dumps(row, separators=(",", ":"), ensure_ascii=False))
+
+    def start(self, guild) -> int:
+        """Startstand (alle Rolleninhaber) als erste Zeile; liefert deren Anzahl."""
+        members = {}
+        for rid in self.role_ids:
+            role = guild.get_role(rid)
+            for member in role.members if role else ():
+                members[member.id] = member
+        rows = [
+            [m.id, m.display_name, str(m.status), 1 if m.voice else 0, self._roles_of(m)]
+            for m in members.values()
+        ]
+        self._emit("init", g=guild.id, ch=self.channel_id, roles=list(self.role_ids), m=rows)
+        return len(rows)
+
+    def presence(self, member):
+        if self._tracked(member):
+            self._emit("p", m=member.id, s=str(member.status))
+
+    def voice(self, member, in_voice: bool):
+        if self._tracked(member):
+            self._emit("v", m=member.id, v=int(in_voice))
+
+    def member(self, before, after):
+        if self._tracked(before) or self._tracked(after):
+            self._emit("u", m=after.id, n=after.display_name, r=self._roles_of(after))
+
+    def remove(self, member):
+        if self._tracked(member):
+            self._emit("x", m=member.id)
+
+    def message(self, message):
+        if message.channel.id == self.channel_id:
+            self._emit("msg", m=message.author.id, n=message.author.display_name,
+                       c=(message.content or "")[:MESSAGE_MAX_CHARS])
+
+    def dump(self) -> Optional[str]:
+        """Gepufferte Zeilen abholen (im Event-Loop); None, wenn nichts anliegt."""
+        if not self._buf:
+            return None
+        payload, self._buf = "\n".join(self._buf) + "\n", []
+        return payload
+
+    def write(self, payload: str):
+        """Blockierendes Anhängen – aus async-Code per asyncio.to_thread aufrufen."""
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(payload)
+
+    async def save(self):
+        """dump() + write() unter Lock, damit Zeilen in der Reihenfolge von "t" landen."""
+        async with self._lock:
+            payload = self.dump()
+            if payload is not None:
+                await asyncio.to_thread(self.write, payload)
+
+    def flush(self):
+        payload = self.dump()
+        if payload is not None:
+            self.write(payload)
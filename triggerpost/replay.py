@@ -0,0 +1,322 @@
+# replay.py  —  Aufzeichnung (°muhhelfer record) offline gegen eine Fake-Guild abspielen und zählen,
+#               wie viele Refresh-Zyklen, Renders, Signatur-Prüfungen und REST-Aufrufe anfallen
+#
+#   python -m triggerpost.replay aufzeichnung.jsonl                      (Auto-Refresh alle 30s)
+#   python -m triggerpost.replay aufzeichnung.jsonl --interval 0 --push 10
+#   python -m triggerpost.replay aufzeichnung.jsonl --adaptive 15:300 --targets columns,dashboard
+#   python -m triggerpost.replay aufzeichnung.jsonl --speed 60           (60-fache Echtzeit)
+#
+# Die Zeit ist virtuell: Events und fällige Refresh-/Push-Termine werden streng in zeitlicher
+# Reihenfolge abgearbeitet, der Cog sieht über die injizierte Uhr dieselben Abstände wie live.
+# Ohne --speed läuft die Aufzeichnung so schnell wie möglich durch.
+import argparse
+import asyncio
+import copy
+import json
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import Optional
+
+import discord
+
+from .coalescer import EditCoalescer
+from .fakes import FakeChannel, FakeGuild, FakeMember, FakeMessage, FakeRole, FakeVoiceState
+from .triggerpost import DEFAULT_GUILD, OVERVIEW_LAYOUTS, PUSH_QUIET_SECONDS, TriggerPost
+
+BOT_ID = 1
+VOICE_CHANNEL_ID = 900
+EXTRA_CHANNEL_BASE = 2_000  # Channel-IDs der per --targets angelegten weiteren Übersichten
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _NullGuildConfig:
+    async def set_raw(self, *_keys, value=None):
+        pass
+
+
+class _NullConfig:
+    """Config-Ersatz: Schreibzugriffe landen nur im Cache des Cogs (zählen aber in config_io_total)."""
+
+    def guild_from_id(self, _guild_id):
+        return _NullGuildConfig()
+
+
+class ReplayBot:
+    def __init__(self, guild: FakeGuild):
+        self.guilds = [guild]
+        self.user = guild.me
+
+    def get_guild(self, guild_id: int) -> Optional[FakeGuild]:
+        return next((g for g in self.guilds if g.id == guild_id), None)
+
+    def add_view(self, _view):
+        pass
+
+
+def load(path: str) -> tuple[dict, list[dict]]:
+    """(Startstand, Events) – die erste Zeile muss der "init"-Eintrag sein."""
+    with open(path, encoding="utf-8") as fh:
+        rows = [json.loads(line) for line in fh if line.strip()]
+    if not rows or rows[0].get("e") != "init":
+        raise SystemExit(f"{path}: keine Aufzeichnung von °muhhelfer record (erste Zeile ist nicht 'init')")
+    return rows[0], rows[1:]
+
+
+def build_guild(header: dict) -> tuple[FakeGuild, FakeChannel]:
+    guild = FakeGuild(header["g"])
+    guild.me = FakeMember(guild, BOT_ID, "TriggerPost", discord.Status.online)
+    guild.me.bot = True
+    for position, role_id in enumerate(header["roles"], start=1):
+        if guild.get_role(role_id) is None:
+            guild._roles[role_id] = FakeRole(guild, role_id, f"Rolle {role_id}", position)
+    for member_id, name, status, in_voice, role_ids in header["m"]:
+        member = guild.add_member(member_id, name, discord.Status(status))
+        if in_voice:
+            member.voice = FakeVoiceState(VOICE_CHANNEL_ID)
+        for role_id in role_ids:
+            member.add_role(guild.get_role(role_id))
+    return guild, guild.add_channel(header.get("ch") or DEFAULT_GUILD["target_channel_id"])
+
+
+async def make_cog(guild: FakeGuild, clock: VirtualClock) -> TriggerPost:
+    cog = TriggerPost.__new__(TriggerPost)
+    cog._init_state(ReplayBot(guild), clock)
+    cog._init_views()
+    cog.config = _NullConfig()
+    # Mindestabstand pro Nachricht würde in Echtzeit schlafen; die Abstände bestimmt hier der Scheduler
+    cog._edits = EditCoalescer(min_interval=0, clock=clock, on_rest=cog._metrics.rest)
+    return cog
+
+
+async def configure(cog: TriggerPost, guild: FakeGuild, channel: FakeChannel, args) -> list[FakeChannel]:
+    """Zielnachricht (und weitere Übersichten) anlegen und die Refresh-Strategie setzen."""
+    author = guild.me
+    intro, embed, view = await cog._render_layout(guild, "main", author)
+    primary = await channel.send(intro, embed=embed, view=view)
+    conf = copy.deepcopy(DEFAULT_GUILD)
+    conf.update(
+        target_channel_id=channel.id,
+        message_id=primary.id,
+        overview_ids_migrated=True,
+        auto_refresh_seconds=args.interval,
+        auto_refresh_adaptive=list(args.adaptive) if args.adaptive else [],
+        push_min_interval=args.push,
+    )
+    channels = [channel]
+    for i, layout in enumerate(args.targets):
+        extra = guild.add_channel(EXTRA_CHANNEL_BASE + i)
+        intro, embed, view = await cog._render_layout(guild, layout, author)
+        sent = await extra.send(intro, embed=embed, view=view)
+        conf["overview_targets"].append({"channel_id": extra.id, "message_id": sent.id, "layout": layout})
+        channels.append(extra)
+    cog._conf_cache[guild.id] = conf
+    cog._rebuild_target_channels()
+    # Startzustand zählt nicht: wie live gilt die bestehende Nachricht als aktuell
+    cog._remember_refresh(guild.id, cog._roster_digest(guild))
+    for store in (cog._metrics.counters, cog._metrics.histograms, cog._metrics.gauges):
+        store.clear()
+    for ch in channels:
+        ch.calls.clear()
+    cog._reschedule_refresh(guild.id, stagger=True)
+    return channels
+
+
+async def _settle(cog: TriggerPost):
+    """Laufende Refresh-Tasks (samt Edits) abschließen, bevor die Zeit weiterläuft."""
+    while cog._refresh_running:
+        await asyncio.gather(*list(cog._refresh_running.values()), return_exceptions=True)
+
+
+async def _advance(cog: TriggerPost, clock: VirtualClock, until: float, pace):
+    """Alle Refresh-/Push-Termine bis `until` in Reihenfolge abarbeiten."""
+    while True:
+        pending = [d for d in (cog._refresh_schedule.peek(), cog._push_schedule.peek()) if d is not None]
+        if not pending or min(pending) > until:
+            break
+        due = min(pending)
+        await pace(due)
+        clock.now = max(clock.now, due)
+        for guild_id, when in cog._refresh_schedule.pop_due():
+            cog._refresh_due(guild_id, when)
+        for guild_id, _when in cog._push_schedule.pop_due():
+            cog._push_due(guild_id)
+        await _settle(cog)
+    await pace(until)
+    clock.now = max(clock.now, until)
+
+
+async def _apply(cog: TriggerPost, guild: FakeGuild, channel: FakeChannel, event: dict):
+    """Event auf die Fake-Guild anwenden und den passenden Listener des Cogs aufrufen."""
+    kind = event["e"]
+    member = guild.get_member(event["m"])
+    if kind == "p" and member is not None:
+        before = copy.copy(member)
+        member.status = discord.Status(event["s"])
+        await cog.on_presence_update(before, member)
+    elif kind == "v" and member is not None:
+        before = SimpleNamespace(channel=member.voice.channel if member.voice else None)
+        member.voice = FakeVoiceState(VOICE_CHANNEL_ID) if event["v"] else None
+        after = SimpleNamespace(channel=member.voice.channel if member.voice else None)
+        await cog.on_voice_state_update(member, before, after)
+    elif kind == "u":
+        if member is None:
+            member = guild.add_member(event["m"], event["n"])
+        before = copy.copy(member)
+        before._roles = dict(member._roles)
+        member.nick = event["n"] if event["n"] != member.name else None
+        wanted = set(event["r"])
+        for role in member.roles:
+            if role.id not in wanted:
+                member.remove_role(role)
+        for role_id in wanted:
+            role = guild.get_role(role_id)
+            if role is not None:
+                member.add_role(role)
+        await cog.on_member_update(before, member)
+    elif kind == "x":
+        member = guild.remove_member(event["m"])
+        if member is not None:
+            await cog.on_member_remove(member)
+    elif kind == "msg":
+        author = member or guild.add_member(event["m"], event["n"], discord.Status.online)
+        message = FakeMessage(channel, next(channel._ids), content=event["c"], author=author)
+        await cog.on_message(message)
+
+
+def _by_label(metrics, name: str, label: str) -> dict[str, int]:
+    out: Counter = Counter()
+    for (metric, labels), value in metrics.counters.items():
+        if metric == name:
+            out[dict(labels).get(label, "")] += value
+    return dict(sorted(out.items()))
+
+
+async def replay(path: str, args) -> dict:
+    header, events = load(path)
+    clock = VirtualClock()
+    guild, channel = build_guild(header)
+    cog = await make_cog(guild, clock)
+    channels = await configure(cog, guild, channel, args)
+
+    wall_start = time.perf_counter()
+
+    async def pace(virtual: float):
+        if args.speed:
+            delay = wall_start + virtual / args.speed - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    for event in events:
+        await _advance(cog, clock, event["t"], pace)
+        await _apply(cog, guild, channel, event)
+    # Nachlauf: der letzte Stand soll noch veröffentlicht werden
+    end = events[-1]["t"] if events else 0.0
+    tail = max(args.interval, args.adaptive[1] if args.adaptive else 0, args.push + PUSH_QUIET_SECONDS)
+    await _advance(cog, clock, end + tail, pace)
+    await _settle(cog)
+    wall = time.perf_counter() - wall_start
+
+    metrics = cog._metrics
+    cycle = metrics.histograms.get(metrics._key("op_latency_seconds", {"op": "refresh_cycle"}))
+    cycles = cycle.count if cycle else 0
+    skipped = _by_label(metrics, "refresh_skipped_total", "reason")
+    early = sum(skipped.get(r, 0) for r in ("no_channel", "warming", "dead_target"))
+    calls: Counter = Counter()
+    for ch in channels:
+        calls.update(ch.calls)
+    rest = _by_label(metrics, "rest_calls_total", "kind")
+    hours = max(clock.now, 1e-9) / 3600
+    return {
+        "recording": path,
+        "members": len(header["m"]),
+        "events": len(events),
+        "event_kinds": dict(sorted(Counter(e["e"] for e in events).items())),
+        "virtual_seconds": round(clock.now, 3),
+        "wall_seconds": round(wall, 4),
+        "strategy": {
+            "interval": args.interval,
+            "adaptive": list(args.adaptive) if args.adaptive else None,
+            "push": args.push,
+            "targets": ["main", *args.targets],
+        },
+        "refresh_cycles": cycles,
+        "refresh_skipped": skipped,
+        "signature_checks": cycles - early,
+        "embed_builds": _by_label(metrics, "embed_builds_total", "layout"),
+        "edits_skipped": _by_label(metrics, "edit_skipped_total", "reason"),
+        "rest_calls": rest,
+        "channel_calls": dict(sorted(calls.items())),
+        "edits_per_hour": round(calls["edit"] / hours, 1),
+    }
+
+
+def _print(result: dict):
+    s = result["strategy"]
+    mode = f"adaptiv {s['adaptive'][0]}–{s['adaptive'][1]}s" if s["adaptive"] else f"{s['interval']}s" if s["interval"] else "aus"
+    kinds = ", ".join(f"{k}={v}" for k, v in result["event_kinds"].items())
+    print(f"Aufzeichnung:     {result['recording']} ({result['members']} Muhhelfer)")
+    print(f"Events:           {result['events']} ({kinds or '–'})")
+    print(f"Dauer:            {result['virtual_seconds']:.0f}s virtuell, {result['wall_seconds']:.3f}s Wandzeit")
+    print(f"Strategie:        Auto-Refresh {mode}, Push {s['push'] or 'aus'}, Übersichten: {', '.join(s['targets'])}")
+    print(f"Refresh-Zyklen:   {result['refresh_cycles']} (Signatur geprüft: {result['signature_checks']})")
+    for label, key in (("übersprungen", "refresh_skipped"), ("Embed-Builds", "embed_builds"),
+                       ("Edit gespart", "edits_skipped"), ("REST (Metrik)", "rest_calls"),
+                       ("REST (Channel)", "channel_calls")):
+        values = ", ".join(f"{k}={v}" for k, v in result[key].items()) or "–"
+        print(f"{label + ':':<18}{values}")
+    print(f"Edits pro Stunde: {result['edits_per_hour']}")
+
+
+def _bounds(text: str) -> tuple[int, int]:
+    low, _sep, high = text.partition(":")
+    try:
+        low_s, high_s = int(low), int(high)
+    except ValueError:
+        raise argparse.ArgumentTypeError("Format: MIN:MAX, z. B. 15:300")
+    if not 0 < low_s <= high_s:
+        raise argparse.ArgumentTypeError("es muss 0 < MIN <= MAX gelten")
+    return low_s, high_s
+
+
+def _layouts(text: str) -> list[str]:
+    layouts = []
+    for name in filter(None, (s.strip().lower() for s in text.split(","))):
+        if name not in OVERVIEW_LAYOUTS:
+            raise argparse.ArgumentTypeError(f"unbekanntes Layout: {name} ({', '.join(sorted(OVERVIEW_LAYOUTS))})")
+        layouts.append(OVERVIEW_LAYOUTS[name])
+    return layouts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TriggerPost-Aufzeichnung offline abspielen (Refresh-Durchsatz)")
+    parser.add_argument("recording", help="JSONL-Datei aus °muhhelfer record")
+    parser.add_argument("--interval", type=int, default=30, help="Auto-Refresh in Sekunden, 0 = aus (Standard: %(default)s)")
+    parser.add_argument("--adaptive", type=_bounds, default=None, metavar="MIN:MAX",
+                        help="adaptives Intervall (braucht --interval > 0)")
+    parser.add_argument("--push", type=int, default=0, help="Push-Modus: Mindestabstand in Sekunden, 0 = aus")
+    parser.add_argument("--targets", type=_layouts, default=[], metavar="LAYOUTS",
+                        help="weitere Übersichten, kommagetrennt (z. B. columns,dashboard)")
+    parser.add_argument("--speed", type=float, default=0, metavar="N",
+                        help="auf N-fache Echtzeit bremsen (Standard: so schnell wie möglich)")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args(argv)
+    if args.adaptive and not args.interval:
+        parser.error("--adaptive braucht ein --interval > 0")
+
+    result = asyncio.run(replay(args.recording, args))
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+    _print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# roster.py  —  Inkrementeller Online-Index der Muhhelfer-Rollen (pro Guild)
+import itertools
+from bisect import bisect_left, insort
+from typing import Any, Callable, Iterable, Optional
+
+import discord
+
+ONLINE_STATES = (discord.Status.online, discord.Status.idle, discord.Status.dnd)
+
+
+def _is_online(member: discord.Member) -> bool:
+    return getattr(member, "status", discord.Status.offline) in ONLINE_STATES
+
+
+class RosterIndex:
+    """Online-Rolleninhaber einer Guild, gepflegt über Presence-/Member-/Voice-Events statt Vollscan.
+
+    `version` wird bei jeder anzeigerelevanten Änderung erhöht (Status, Voice, Name, Rollen).
+    `serial` unterscheidet neu aufgebaute Indizes, (serial, version) taugt also als Render-Signatur.
+
+    Pro Rolle liegt eine per bisect sortiert gehaltene Liste (sort_key(member), member_id); der
+    Schlüssel wird nur bei einem Event für das betroffene Mitglied berechnet, nie beim Rendern.
+    """
+
+    _serials = itertools.count(1)
+
+    def __init__(self, role_ids: Iterable[int], sort_key: Callable[[discord.Member], Any]):
+        self.role_ids: tuple[int, ...] = tuple(role_ids)
+        self._sort_key = sort_key
+        self.serial = next(self._serials)
+        self.online: dict[int, dict[int, discord.Member]] = {rid: {} for rid in self.role_ids}
+        self.version = 0
+        self._order: dict[int, list[tuple[Any, int]]] = {rid: [] for rid in self.role_ids}
+        self._keys: dict[int, dict[int, tuple[Any, int]]] = {rid: {} for rid in self.role_ids}
+        self._lists: dict[int, list[discord.Member]] = {}
+
+    @classmethod
+    def build(cls, guild: discord.Guild, role_ids: Iterable[int], sort_key) -> "RosterIndex":
+        index = cls(role_ids, sort_key)
+        for rid in index.role_ids:
+            role = guild.get_role(rid)
+            if not role:
+                continue
+            bucket, keys = index.online[rid], index._keys[rid]
+            for m in role.members:
+                if _is_online(m):
+                    bucket[m.id] = m
+                    keys[m.id] = (sort_key(m), m.id)
+            index._order[rid] = sorted(keys.values())  # einmal voll sortieren, danach nur noch bisect
+        return index
+
+    def tracks(self, member: discord.Member) -> bool:
+        """Hat (oder hatte) das Mitglied eine der beobachteten Rollen?"""
+        mid = member.id
+        if any(mid in bucket for bucket in self.online.values()):
+            return True
+        return any(member.get_role(rid) is not None for rid in self.role_ids)
+
+    def update_member(self, member: discord.Member) -> bool:
+        """Mitglied neu einordnen. True, wenn sich die Anzeige ändern kann."""
+        online = _is_online(member)
+        entry = None
+        changed = False
+        for rid in self.role_ids:
+            if online and member.get_role(rid) is not None:
+                if entry is None:
+                    entry = (self._sort_key(member), member.id)
+                changed |= self._place(rid, member, entry)
+            else:
+                changed |= self._drop(rid, member.id)
+        if changed:
+            self.version += 1
+        return changed
+
+    def remove_member(self, member_id: int) -> bool:
+        changed = False
+        for rid in self.role_ids:
+            changed |= self._drop(rid, member_id)
+        if changed:
+            self.version += 1
+        return changed
+
+    def _place(self, rid: int, member: discord.Member, entry: tuple[Any, int]) -> bool:
+        """Einfügen bzw. umsortieren: O(log n) Suche + ein Listen-Insert."""
+        bucket, keys, order = self.online[rid], self._keys[rid], self._order[rid]
+        old = keys.get(member.id)
+        if old == entry:
+            bucket[member.id] = member  # gleiche Position/Anzeige, nur das Objekt auffrischen
+            return False
+        if old is not None:
+            del order[bisect_left(order, old)]
+        insort(order, entry)
+        keys[member.id] = entry
+        bucket[member.id] = member
+        self._lists.pop(rid, None)
+        return True
+
+    def _drop(self, rid: int, member_id: int) -> bool:
+        old = self._keys[rid].pop(member_id, None)
+        if old is None:
+            return False
+        order = self._order[rid]
+        del order[bisect_left(order, old)]
+        del self.online[rid][member_id]
+        self._lists.pop(rid, None)
+        return True
+
+    def members(self, role_id: int) -> list[discord.Member]:
+        """Sortierte Online-Liste als linearer Durchlauf der gepflegten Ordnung (bis zur nächsten Änderung gecacht)."""
+        cached: Optional[list[discord.Member]] = self._lists.get(role_id)
+        if cached is None:
+            bucket = self.online.get(role_id, {})
+            cached = self._lists[role_id] = [bucket[mid] for _key, mid in self._order.get(role_id, ())]
+        return cached
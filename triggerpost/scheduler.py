@@ -0,0 +1,81 @@
+# scheduler.py  —  Min-Heap-Scheduler: schläft bis zum frühesten fälligen Termin
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable, Hashable, Optional
+
+
+class DeadlineScheduler:
+    """Termine pro Key in einem Min-Heap. Pro Key gilt nur der zuletzt gesetzte Termin;
+    überholte Heap-Einträge werden beim Herausnehmen verworfen (lazy deletion).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._due: dict[Hashable, float] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._due
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def now(self) -> float:
+        return self._clock()
+
+    def due_at(self, key: Hashable) -> Optional[float]:
+        return self._due.get(key)
+
+    def schedule(self, key: Hashable, when: float):
+        self._due[key] = when
+        heapq.heappush(self._heap, (when, next(self._seq), key))
+        if self._heap[0][2] == key:
+            self._wakeup.set()  # neuer frühester Termin → Warten neu berechnen
+
+    def cancel(self, key: Hashable):
+        self._due.pop(key, None)
+
+    def _drop_stale(self):
+        heap, due = self._heap, self._due
+        while heap and due.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def peek(self) -> Optional[float]:
+        """Frühester gültiger Termin (oder None), ohne etwas auszutragen."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self) -> list[tuple[Hashable, float]]:
+        """Alle jetzt fälligen (key, termin) austragen, ohne zu warten (z. B. für Replays mit eigener Uhr)."""
+        now = self._clock()
+        ready = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _seq, key = heapq.heappop(self._heap)
+            if self._due.get(key) == when:
+                del self._due[key]
+                ready.append((key, when))
+        return ready
+
+    async def next_due(self) -> list[tuple[Hashable, float]]:
+        """Wartet bis zum frühesten Termin und liefert alle fälligen (key, termin).
+        Die Keys sind danach ausgetragen und müssen bei Bedarf neu eingeplant werden."""
+        while True:
+            self._drop_stale()
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+            delay = self._heap[0][0] - self._clock()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            ready = self.pop_due()
+            if ready:
+                return ready
@@ -0,0 +1,55 @@
+# snapshot.py  —  Letzter bekannter Roster pro Guild auf Platte (kompaktes JSON, atomar geschrieben)
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+
+class SnapshotStore:
+    """Guild-ID -> Snapshot-Dict. Geschrieben wird nur, was seit dem letzten flush() geändert wurde."""
+
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self._data: dict[int, dict] = {}
+        self._dirty = False
+
+    def load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return  # kaputte/halbe Datei → ohne Snapshot starten
+        self._data = {int(gid): snap for gid, snap in raw.items() if isinstance(snap, dict)}
+
+    def guild_ids(self) -> list[int]:
+        return list(self._data)
+
+    def get(self, guild_id: int) -> Optional[dict]:
+        return self._data.get(guild_id)
+
+    def put(self, guild_id: int, snapshot: dict):
+        self._data[guild_id] = snapshot
+        self._dirty = True
+
+    def discard(self, guild_id: int):
+        if self._data.pop(guild_id, None) is not None:
+            self._dirty = True
+
+    def dump(self) -> Optional[str]:
+        """Serialisiert (im Event-Loop) und setzt das Dirty-Flag zurück; None, wenn nichts zu tun ist."""
+        if not self._dirty or self.path is None:
+            return None
+        self._dirty = False
+        return json.dumps({str(gid): snap for gid, snap in self._data.items()}, separators=(",", ":"), ensure_ascii=False)
+
+    def write(self, payload: str):
+        """Blockierendes Schreiben – aus async-Code per asyncio.to_thread aufrufen."""
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(payload, encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def flush(self):
+        payload = self.dump()
+        if payload is not None:
+            self.write(payload)
@@ -1,14 +1,36 @@
 # triggerpost.py  —  Auto-Refresh postet NIE neu; editiert nur bestehende Nachricht
+import asyncio
+import copy
+import functools
+import hashlib
+import io
+import json
+import logging
+import random
 import re
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 import discord
-from discord import ui, AllowedMentions
-from discord.ext import tasks
+from discord import ui
 from redbot.core import commands, Config
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
+
+from .coalescer import EditCoalescer
+from .churn import ChurnRate, adaptive_interval
+from .cooldowns import CooldownStore
+from .matcher import TriggerMatcher
+from .metrics import Metrics, attach_rate_limit_counter, detach_rate_limit_counter
+from .paging import DASH_FIELDS_PER_PAGE, FIELD_LIMIT, MAIN_SECTION_LIMIT, chunk_lines, clamp, page_label, page_of
+from .pings import RolePingBatcher
+from .recorder import EventRecorder
+from .roster import RosterIndex
+from .scheduler import DeadlineScheduler
+from .snapshot import SnapshotStore
+
+log = logging.getLogger("red.kuhmuh.triggerpost")
 
 # ====== Server-spezifische IDs ======
 ROLE_NORMAL = 1424768638157852682            # Muhhelfer – Normal
@@ -33,8 +55,32 @@ DEFAULT_GUILD = {
     "force_role_ping": True,
     "auto_refresh_seconds": 0,
     "rolesource_url": None,
+    "overview_message_ids": [],      # vom Bot im Zielchannel gepostete Übersichten (für Cleanup)
+    "overview_ids_migrated": False,  # einmaliger History-Scan für Altbestand erledigt?
+    "lazy_members": False,           # nur Muhhelfer nachladen, bis dahin aus dem Snapshot rendern
+    "overview_targets": [],          # weitere Übersichten: {"channel_id", "message_id", "layout"}
+    "auto_refresh_adaptive": [],     # [min, max] → Intervall folgt der Roster-Änderungsrate
+    "push_min_interval": 0,          # Push-Modus: bei Roster-Änderung editieren, höchstens alle N s (0 = aus)
 }
 
+PING_COOLDOWN_SECONDS = 60  # Ping-Buttons: pro Channel
+SNAPSHOT_FLUSH_SECONDS = 60  # Roster-Snapshot höchstens so oft auf Platte schreiben
+REFRESH_CONCURRENCY = 4      # so viele Guilds refreshen gleichzeitig
+PUSH_QUIET_SECONDS = 2.0     # Push-Modus: nach so viel Ruhe sofort editieren
+PUSH_MIN_INTERVAL = 5        # kleinster erlaubter Mindestabstand für °muhhelfer pushrefresh
+TARGET_CONCURRENCY = 3       # so viele Übersichten einer Guild werden gleichzeitig editiert
+MAX_OVERVIEW_TARGETS = 10
+
+# Auto-refreshbare Layouts (Layout 4 ist statisch); Aliase wie bei °muhhelfer test
+OVERVIEW_LAYOUTS = {
+    "main": "main",
+    "layout1": "columns", "columns": "columns",
+    "layout2": "dashboard", "dashboard": "dashboard",
+    "layout3": "dashboard_role", "dashboard_role": "dashboard_role",
+}
+
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)  # Discord: Bulk-Delete nur < 14 Tage
+
 # ====== Status & Sortierung ======
 def _status_icon(member: discord.Member) -> str:
     st = getattr(member, "status", discord.Status.offline)
@@ -61,74 +107,200 @@ def _sort_key(member: discord.Member):
         st_rank = 2
     else:
         st_rank = 3
-    return (voice_rank, st_rank, member.display_name.lower())
+    return (voice_rank, st_rank, member.display_name.casefold())
+
+
+def _digest(text: str) -> str:
+    """Kurzer, stabiler Hash (Signatur/Embed-Body) – kompakt genug für die Platte."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _embed_digest(embed: discord.Embed) -> str:
+    """Hash des Embeds ohne Footer und Zeitstempel (die ändern sich bei jedem Rendern)."""
+    data = embed.to_dict()
+    data.pop("footer", None)
+    data.pop("timestamp", None)
+    return _digest(json.dumps(data, sort_keys=True, ensure_ascii=False))
+
+
+def _timed(op: str):
+    """Latenz der async-Methode unter `op` in self._metrics erfassen (REST-Aufrufe darin zählen zu `op`)."""
+    def deco(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            with self._metrics.timer(op):
+                return await fn(self, *args, **kwargs)
+        return wrapper
+    return deco
 
 
 class TriggerPost(commands.Cog):
     """Muhhelfer-System: Trigger, Main-Embed, Test-Layouts, Buttons, Auto-Refresh, Role-Source-Link."""
 
-    _ping_cd_until: dict[int, float] = {}
-
     def __init__(self, bot: Red):
-        self.bot = bot
         self.config = Config.get_conf(self, identifier=81521025, force_registration=True)
         self.config.register_guild(**DEFAULT_GUILD)
-        self._cooldown_until = {}
-        self._last_signature: dict[int, str] = {}
-        self._last_refresh_ts: dict[int, float] = {}
+        self._init_state(bot)
+        self._init_views()
+
+    def _init_views(self):
+        """Eine persistente View-Instanz pro Layout, für alle Posts und Edits wiederverwendet.
+        Zustand (Tab, Admin-Block) wird aus der jeweiligen Nachricht gelesen, nicht aus der View."""
+        self._views: dict[str, ui.View] = {
+            "ping": self.PingView(self),
+            "columns": self.ColumnsView(self),
+            "dashboard": self.DashboardView(self, with_role_button=False),
+            "dashboard_role": self.DashboardView(self, with_role_button=True),
+            "commands": self.CommandsView(self),
+        }
+        # Fallback für Nachrichten aus früheren Läufen (gleiche custom_ids → je eine Instanz)
         try:
-            self.bot.add_view(self.PingView(self))
-            self.bot.add_view(self.ColumnsView(self))
-            self.bot.add_view(self.DashboardView(self))
-            self.bot.add_view(self.CommandsView(self))
+            for name in ("ping", "columns", "dashboard", "commands"):
+                self.bot.add_view(self._views[name])
         except Exception:
             pass
-        self._auto_refresher.start()
+
+    def _init_state(self, bot: Red, clock=time.monotonic):
+        """Reiner In-Memory-Zustand ohne Config und Views – so auch offline (bench.py, replay.py) nutzbar.
+        `clock` treibt Cooldowns, Scheduler, Coalescer und Churn (Replay: virtuelle Zeit)."""
+        self.bot = bot
+        self._clock = clock
+        self._cooldowns = CooldownStore(clock)  # Keys: ("ping", channel_id), ("post", channel_id)
+        self._last_body: dict[int, str] = {}  # Digest der Roster-Zeilen (inkl. Icons) beim letzten Auto-Edit
+        # Message-ID -> (Content-Digest, Embed-Digest) des zuletzt dorthin geschickten Stands
+        self._sent_hashes: dict[int, tuple[str, str]] = {}
+        self._matchers: dict[int, TriggerMatcher] = {}
+        # Write-through-Cache der Guild-Config (wird in cog_load befüllt, Setter halten ihn aktuell)
+        self._conf_cache: dict[int, dict] = {}
+        self._target_channels: set[int] = set()
+        self._rosters: dict[int, RosterIndex] = {}
+        self._render_cache: dict[tuple[int, str, str], tuple[tuple[int, int], object]] = {}
+        # Zeile pro Mitglied, gültig solange (status, in_voice) gleich bleibt; Presence/Voice verwirft
+        self._member_lines: dict[int, tuple[discord.Status, bool, str]] = {}
+        self._role_lines: dict[tuple[int, int], tuple[tuple[int, int], list[str]]] = {}  # (Guild, Rolle)
+        self._refresh_schedule = DeadlineScheduler(clock)
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_slots = asyncio.Semaphore(REFRESH_CONCURRENCY)
+        self._refresh_running: dict[int, asyncio.Task] = {}  # laufender Refresh pro Guild
+        # Push-Modus: Roster-Änderungen markieren die Guild, der Debouncer plant den Edit ein
+        self._push_schedule = DeadlineScheduler(clock)
+        self._push_task: Optional[asyncio.Task] = None
+        self._push_dirty_since: dict[int, float] = {}  # erste unveröffentlichte Änderung
+        self._push_last: dict[int, float] = {}         # letzter Push-Edit
+        self._churn: dict[int, ChurnRate] = {}  # Roster-Änderungsrate pro Guild (adaptives Intervall)
+        # Zielnachricht pro Guild als PartialMessage (Edit ohne vorheriges fetch_message)
+        self._target_handles: dict[int, discord.PartialMessage] = {}
+        self._target_views: dict[int, ui.View] = {}  # zuletzt an der Zielnachricht gesetzte View
+        self._dead_targets: set[int] = set()  # NotFound beim Edit → bis zur nächsten Config-Änderung ruhen
+        # weitere Übersichten (overview_targets), nach Message-ID
+        self._overview_views: dict[int, ui.View] = {}
+        self._dead_overviews: set[int] = set()
+        self._pages: dict[int, int] = {}  # Message-ID -> per Button gewählte Seite (fehlt = Seite 1)
+        self._tabs: dict[int, str] = {}   # Message-ID -> per Button gewählter Dashboard-Tab (fehlt = Übersicht)
+        self._metrics = Metrics()
+        self._rate_limit_handler = None
+        self._edits = EditCoalescer(clock=clock, on_rest=self._metrics.rest)  # bündelt Edits derselben Nachricht
+        self._pings = RolePingBatcher(on_rest=self._metrics.rest)  # ein Mentionable-Toggle pro Burst
+        # Lazy-Modus: Rolleninhaber gezielt nachladen; bis dahin aus dem letzten Snapshot rendern
+        self._snapshots = SnapshotStore(None)
+        self._snapshot_sigs: dict[int, tuple[int, int]] = {}  # Roster-Signatur beim letzten Snapshot
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._warm: set[int] = set()  # Lazy-Guilds, deren Muhhelfer geladen sind
+        self._chunk_pending: set[int] = set()  # warm nur aus dem Snapshot, Voll-Chunk läuft noch
+        self._warm_tasks: dict[int, asyncio.Task] = {}
+        # Letzter Auto-Refresh-Stand pro Guild, überlebt Neustarts (sonst editiert der erste Zyklus alles)
+        self._refresh_state = SnapshotStore(None)
+        self._recorders: dict[int, EventRecorder] = {}  # laufende Aufzeichnungen (°muhhelfer record)
+
+    async def cog_load(self):
+        # einziger Config-Lesezugriff: danach entscheiden Refresher, Listener und Buttons nur
+        # noch aus dem Cache, den _conf_set bei jedem Schreiben mitführt
+        all_guilds = await self.config.all_guilds()
+        self._metrics.inc("config_io_total", op="read_all")
+        self._conf_cache = {gid: data for gid, data in all_guilds.items()}
+        self._rebuild_target_channels()
+        self._snapshots = SnapshotStore(cog_data_path(self) / "roster_snapshot.json")
+        self._snapshots.load()
+        self._refresh_state = SnapshotStore(cog_data_path(self) / "refresh_state.json")
+        self._refresh_state.load()
+        for guild_id in self._refresh_state.guild_ids():
+            self._last_body[guild_id] = self._refresh_state.get(guild_id).get("body")
+        self._rate_limit_handler = attach_rate_limit_counter(self._metrics)
+        self._refresh_task = asyncio.create_task(self._auto_refresher())
+        self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+        self._push_task = asyncio.create_task(self._push_refresher())
+        for guild in self.bot.guilds:
+            self._maybe_warm(guild)
 
     def cog_unload(self):
+        for task in (self._refresh_task, self._snapshot_task, self._push_task, *self._warm_tasks.values(),
+                     *self._refresh_running.values()):
+            if task:
+                task.cancel()
+        self._pings.close()
+        detach_rate_limit_counter(self._rate_limit_handler)
         try:
-            self._auto_refresher.cancel()
-        except Exception:
-            pass
+            self._snapshots.flush()
+            self._refresh_state.flush()
+            for recorder in self._recorders.values():
+                recorder.flush()
+        except OSError:
+            log.warning("Roster-Snapshot konnte nicht geschrieben werden", exc_info=True)
 
     # ====== Utility ======
     @staticmethod
     def _now_str() -> str:
         return datetime.now().strftime("%d.%m.%Y, %H:%M")
 
-    def _signature_for_guild(self, guild: discord.Guild) -> str:
-        def sig_for_role(role_id: int):
-            role = guild.get_role(role_id)
-            if not role:
-                return ""
-            mems = [
-                m for m in role.members
-                if getattr(m, "status", discord.Status.offline) in (
-                    discord.Status.online, discord.Status.idle, discord.Status.dnd
-                )
-            ]
-            mems.sort(key=_sort_key)
-            ids = [m.id for m in mems]
-            return ",".join(map(str, ids))
-        return f"N:{sig_for_role(ROLE_NORMAL)}|S:{sig_for_role(ROLE_SCHWER)}"
-
-    async def _force_role_mention_once(self, *, guild: discord.Guild, channel, role: discord.Role, content: str):
-        me: discord.Member = guild.me  # type: ignore
-        perms = channel.permissions_for(me)
-        if perms.mention_everyone or role.mentionable:
-            return await channel.send(content, allowed_mentions=AllowedMentions(roles=True, users=True, everyone=False))
-        can_manage = perms.manage_roles and (role.position < (me.top_role.position if me.top_role else 0))
-        if not can_manage:
-            return await channel.send(content, allowed_mentions=AllowedMentions(roles=True, users=True, everyone=False))
-        try:
-            await role.edit(mentionable=True, reason="Force role ping (temporary)")
-            msg = await channel.send(content, allowed_mentions=AllowedMentions(roles=True, users=True, everyone=False))
-        finally:
-            try:
-                await role.edit(mentionable=False, reason="Force role ping (revert)")
-            except Exception:
-                pass
-        return msg
+    # ====== Config-Cache ======
+    def _conf(self, guild_id: int) -> dict:
+        """Config-Snapshot aus dem Speicher. Guilds ohne gespeicherte Daten haben die Defaults."""
+        conf = self._conf_cache.get(guild_id)
+        if conf is None:
+            conf = self._conf_cache[guild_id] = copy.deepcopy(DEFAULT_GUILD)
+        return conf
+
+    async def _conf_set(self, guild_id: int, key: str, value):
+        """Schreibt in Config UND Cache – alle Setter laufen hierüber."""
+        await self.config.guild_from_id(guild_id).set_raw(key, value=value)
+        self._metrics.inc("config_io_total", op="write")
+        self._conf(guild_id)[key] = value
+        if key == "target_channel_id":
+            self._rebuild_target_channels()
+        if key in ("target_channel_id", "message_id"):
+            self._target_handles.pop(guild_id, None)
+            self._target_views.pop(guild_id, None)
+            self._dead_targets.discard(guild_id)
+            self._forget_refresh(guild_id)  # neue Zielnachricht muss beim nächsten Zyklus editiert werden
+        if key == "overview_targets":
+            for target in value:
+                self._dead_overviews.discard(target["message_id"])
+        if key in ("auto_refresh_seconds", "auto_refresh_adaptive", "target_channel_id", "message_id", "overview_targets"):
+            self._reschedule_refresh(guild_id)
+        if key == "push_min_interval" and not value:
+            self._push_schedule.cancel(guild_id)
+            self._push_dirty_since.pop(guild_id, None)
+        elif key == "triggers":
+            self._matchers.pop(guild_id, None)
+
+    def _rebuild_target_channels(self):
+        targets = {conf.get("target_channel_id") for conf in self._conf_cache.values()}
+        targets.add(DEFAULT_GUILD["target_channel_id"])  # Guilds ohne gespeicherte Daten
+        targets.discard(None)
+        self._target_channels = targets
+
+    def _matcher_for(self, guild_id: int) -> TriggerMatcher:
+        """Kompilierter Matcher pro Guild; wird nur bei add/removetrigger neu gebaut."""
+        matcher = self._matchers.get(guild_id)
+        if matcher is None:
+            matcher = self._matchers[guild_id] = TriggerMatcher(self._conf(guild_id)["triggers"])
+        return matcher
+
+    def _target_handle(self, channel, message_id: int) -> discord.PartialMessage:
+        handle = self._target_handles.get(channel.guild.id)
+        if handle is None or handle.id != int(message_id) or handle.channel.id != channel.id:
+            handle = self._target_handles[channel.guild.id] = channel.get_partial_message(int(message_id))
+        return handle
 
     async def _handle_ping_button(self, interaction: discord.Interaction, role_id: int):
         channel = interaction.channel
@@ -140,51 +312,125 @@ class TriggerPost(commands.Cog):
         is_admin = user.guild_permissions.administrator or user.guild_permissions.manage_guild
         has_bypass = any(r.id == ROLE_OFFIZIERE_BYPASS for r in getattr(user, "roles", []))
 
-        now = time.time()
-        until = self._ping_cd_until.get(channel.id, 0)
-        PING_CD = 60
         if not (is_admin or has_bypass):
-            if now < until:
-                remaining = int(until - now)
-                return await interaction.response.send_message(f"⏱️ Bitte warte **{remaining}s**.", ephemeral=True)
-            self._ping_cd_until[channel.id] = now + PING_CD
+            remaining = self._cooldowns.hit(("ping", channel.id), PING_COOLDOWN_SECONDS)
+            if remaining:
+                return await interaction.response.send_message(f"⏱️ Bitte warte **{int(remaining)}s**.", ephemeral=True)
 
         role = guild.get_role(role_id)
         if not role:
             return await interaction.response.send_message("⚠️ Rolle nicht gefunden.", ephemeral=True)
 
-        content = f"🔔 {role.mention} – angefragt von {user.mention}"
         await interaction.response.defer(ephemeral=False, thinking=False)
-        force_on = await self.config.guild(guild).force_role_ping()
-        if force_on:
-            await self._force_role_mention_once(guild=guild, channel=channel, role=role, content=content)
-        else:
-            await channel.send(content, allowed_mentions=AllowedMentions(roles=True, users=True, everyone=False))
+        # Pings derselben Rolle werden kurz gesammelt und gemeinsam gesendet
+        await self._pings.request(channel, role, user.mention, force=self._conf(guild.id)["force_role_ping"])
 
     # ====== Member-Listen ======
-    @staticmethod
-    def _online_members(guild: discord.Guild, role_id: int):
-        role = guild.get_role(role_id)
-        if not role:
-            return []
-        members = [
-            m for m in role.members
-            if getattr(m, "status", discord.Status.offline) in (discord.Status.online, discord.Status.idle, discord.Status.dnd)
-        ]
-        members.sort(key=_sort_key)
-        return members
+    def _roster_loaded(self, guild: discord.Guild) -> bool:
+        """Voll gechunkt oder (Lazy-Modus) die bekannten Muhhelfer nachgeladen."""
+        return guild.chunked or guild.id in self._warm
+
+    def _roster(self, guild: discord.Guild) -> RosterIndex:
+        """Online-Index der Muhhelfer-Rollen. Erst gecacht, wenn die Mitglieder geladen sind,
+        vorher fehlen Mitglieder im Cache und Events würden den Index nicht vervollständigen."""
+        index = self._rosters.get(guild.id)
+        if index is None:
+            index = RosterIndex.build(guild, (ROLE_NORMAL, ROLE_SCHWER), _sort_key)
+            if self._roster_loaded(guild):
+                self._rosters[guild.id] = index
+        return index
+
+    def _online_members(self, guild: discord.Guild, role_id: int):
+        return self._roster(guild).members(role_id)
+
+    def _serving_snapshot(self, guild: discord.Guild) -> Optional[dict]:
+        """Lazy-Modus, Muhhelfer noch nicht geladen → letzter bekannter Roster aus dem Snapshot."""
+        if self._roster_loaded(guild) or not self._conf(guild.id).get("lazy_members"):
+            return None
+        return self._snapshots.get(guild.id)
+
+    def _roster_lines(self, guild: discord.Guild, role_id: int) -> list[str]:
+        """Gerenderte Zeilen "<Status-Icon> <Mention>" der Online-Muhhelfer einer Rolle."""
+        snap = self._serving_snapshot(guild)
+        if snap is not None:
+            return snap["lines"].get(str(role_id), [])
+        index = self._roster(guild)
+        key = (guild.id, role_id)
+        sig = (index.serial, index.version)
+        hit = self._role_lines.get(key)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        cache, lines = self._member_lines, []
+        for m in index.members(role_id):
+            hit = cache.get(m.id)
+            if hit is None or hit[0] is not m.status or hit[1] != (m.voice is not None):
+                lines.append(self._member_line(m))
+            else:
+                lines.append(hit[2])
+        if self._rosters.get(guild.id) is index:
+            self._role_lines[key] = (sig, lines)  # von allen Layouts eines Refreshs geteilt
+        return lines
+
+    def _member_line(self, member: discord.Member) -> str:
+        status = getattr(member, "status", discord.Status.offline)
+        in_voice = bool(getattr(member, "voice", None))
+        hit = self._member_lines.get(member.id)
+        if hit is not None and hit[0] is status and hit[1] == in_voice:
+            return hit[2]
+        line = f"{_status_icon(member)} {member.mention}"
+        self._member_lines[member.id] = (status, in_voice, line)
+        return line
 
     # ====== EMBEDS ======
-    async def _embed_main(self, guild: discord.Guild, author: discord.Member, *, manual_info: Optional[str] = None, footer_note: Optional[str] = None):
-        normal = self._online_members(guild, ROLE_NORMAL)
-        schwer = self._online_members(guild, ROLE_SCHWER)
-
-        def render(name, members):
-            if not members:
-                return f"{name}:\n– aktuell niemand –"
-            return f"{name}:\n" + "\n".join(f"{_status_icon(m)} {m.mention}" for m in members)
+    def _cached_body(self, guild: discord.Guild, layout: str, tab: str, build):
+        """Embed-Inhalt (ohne Footer/Zeitstempel) pro (Guild, Layout, Tab) merken, solange sich
+        Roster/Status/Voice nicht geändert haben. Ohne gecachten Roster-Index wird nicht gemerkt."""
+        key = (guild.id, layout, tab)
+        sig = None
+        if self._serving_snapshot(guild) is None:
+            index = self._roster(guild)
+            if self._rosters.get(guild.id) is index:
+                sig = (index.serial, index.version)
+                hit = self._render_cache.get(key)
+                if hit is not None and hit[0] == sig:
+                    return hit[1]
+            else:
+                self._render_cache.pop(key, None)
+        body = build()
+        self._metrics.inc("embed_builds_total", layout=layout)
+        if sig is not None:
+            self._render_cache[key] = (sig, body)
+        return body
+
+    def _roster_digest(self, guild: discord.Guild) -> str:
+        """Hash über alle gerenderten Roster-Zeilen (alle Seiten) – ändert sich genau dann,
+        wenn sich irgendeine Übersicht sichtbar ändert."""
+        normal = self._roster_lines(guild, ROLE_NORMAL)
+        schwer = self._roster_lines(guild, ROLE_SCHWER)
+        return _digest("\n".join(normal) + "\x00" + "\n".join(schwer))
 
-        desc = f"{render('Muhhelfer – normal', normal)}\n\n{render('Muhhelfer – schwer', schwer)}"
+    @staticmethod
+    def _footer(e: discord.Embed, text: str, page: int, pages: int):
+        label = page_label(page, pages)
+        e.set_footer(text=f"{label} • {text}" if label else text)
+
+    # Blockgrenzen werden beim Rendern einmal berechnet und mit dem Body gecacht; ein Seitenwechsel
+    # wählt nur den passenden Block aus.
+    @_timed("embed_main")
+    async def _embed_main(self, guild: discord.Guild, author: discord.Member, *, manual_info: Optional[str] = None, footer_note: Optional[str] = None, page: int = 1):
+        def build():
+            normal = self._roster_lines(guild, ROLE_NORMAL)
+            schwer = self._roster_lines(guild, ROLE_SCHWER)
+            return chunk_lines(normal, MAIN_SECTION_LIMIT), chunk_lines(schwer, MAIN_SECTION_LIMIT)
+
+        chunks_n, chunks_s = self._cached_body(guild, "main", "", build)
+        pages = max(len(chunks_n), len(chunks_s))
+        page = clamp(page, pages)
+
+        def section(name, chunks):
+            return f"{name}:\n" + (chunks[page - 1] if page <= len(chunks) else "– keine weiteren –")
+
+        desc = f"{section('Muhhelfer – normal', chunks_n)}\n\n{section('Muhhelfer – schwer', chunks_s)}"
         title_text = f"{EMOJI_TITLE} Muhhelfer – Übersicht"
         if manual_info:
             title_text += f"\n*({manual_info})*"
@@ -194,48 +440,55 @@ class TriggerPost(commands.Cog):
         foot = f"Angefragt von: {author.display_name} • Letzte Aktualisierung: {self._now_str()}"
         if footer_note:
             foot += f" • {footer_note}"
-        e.set_footer(text=foot)
+        self._footer(e, foot, page, pages)
         e.timestamp = discord.utils.utcnow()
         return e
 
-    async def _embed_columns(self, guild: discord.Guild, author: discord.Member):
-        normal = self._online_members(guild, ROLE_NORMAL)
-        schwer = self._online_members(guild, ROLE_SCHWER)
-
-        def block(members):
-            if not members:
-                return "– aktuell niemand –"
-            return "\n".join(f"{_status_icon(m)} {m.mention}" for m in members)
-
+    @_timed("embed_columns")
+    async def _embed_columns(self, guild: discord.Guild, author: discord.Member, *, page: int = 1):
+        def build():
+            normal = self._roster_lines(guild, ROLE_NORMAL)
+            schwer = self._roster_lines(guild, ROLE_SCHWER)
+            head = f"**Normal:** {len(normal)} • **Schwer:** {len(schwer)}"
+            return head, chunk_lines(normal, FIELD_LIMIT), chunk_lines(schwer, FIELD_LIMIT)
+
+        head, chunks_n, chunks_s = self._cached_body(guild, "columns", "", build)
+        pages = max(len(chunks_n), len(chunks_s))
+        page = clamp(page, pages)
         title = f"{EMOJI_TITLE} Muhhelfer – Spaltenansicht"
         e = discord.Embed(title=title, color=discord.Color.blue())
-        e.description = f"**Normal:** {len(normal)} • **Schwer:** {len(schwer)}"
+        e.description = head
         e.set_thumbnail(url=MUHKU_THUMBNAIL)
-        e.add_field(name="Muhhelfer – normal", value=block(normal), inline=True)
-        e.add_field(name="Muhhelfer – schwer", value=block(schwer), inline=True)
-        e.set_footer(text=f"Letzte Aktualisierung: {self._now_str()}")
+        e.add_field(name="Muhhelfer – normal", value=chunks_n[page - 1] if page <= len(chunks_n) else "– keine weiteren –", inline=True)
+        e.add_field(name="Muhhelfer – schwer", value=chunks_s[page - 1] if page <= len(chunks_s) else "– keine weiteren –", inline=True)
+        self._footer(e, f"Letzte Aktualisierung: {self._now_str()}", page, pages)
         e.timestamp = discord.utils.utcnow()
         return e
 
-    async def _embed_dashboard(self, guild: discord.Guild, tab: str):
-        normal = self._online_members(guild, ROLE_NORMAL)
-        schwer = self._online_members(guild, ROLE_SCHWER)
-        in_voice_n = sum(1 for m in normal if getattr(m, "voice", None))
-        in_voice_s = sum(1 for m in schwer if getattr(m, "voice", None))
-
+    @_timed("embed_dashboard")
+    async def _embed_dashboard(self, guild: discord.Guild, tab: str, *, page: int = 1):
+        def build():
+            normal = self._roster_lines(guild, ROLE_NORMAL)
+            schwer = self._roster_lines(guild, ROLE_SCHWER)
+            in_voice_n = sum(1 for line in normal if line.startswith("🎙️"))
+            in_voice_s = sum(1 for line in schwer if line.startswith("🎙️"))
+            head = f"📊 **Normal:** {len(normal)} online • **Schwer:** {len(schwer)} online • 🎙️ Voice: N {in_voice_n} | S {in_voice_s}"
+
+            if tab not in ("normal", "schwer"):
+                return head, [[]]
+            chunks = chunk_lines(normal if tab == "normal" else schwer, FIELD_LIMIT)
+            return head, [chunks[i:i + DASH_FIELDS_PER_PAGE] for i in range(0, len(chunks), DASH_FIELDS_PER_PAGE)]
+
+        head, field_pages = self._cached_body(guild, "dashboard", tab, build)
+        page = clamp(page, len(field_pages))
         title = f"{EMOJI_TITLE} Muhhelfer – Dashboard"
-        head = f"📊 **Normal:** {len(normal)} online • **Schwer:** {len(schwer)} online • 🎙️ Voice: N {in_voice_n} | S {in_voice_s}"
         e = discord.Embed(title=title, description=head, color=discord.Color.blue())
         e.set_thumbnail(url=MUHKU_THUMBNAIL)
+        for i, value in enumerate(field_pages[page - 1]):
+            # nur das erste Feld trägt den Namen – daran erkennt _tab_of den aktiven Tab
+            e.add_field(name=f"Muhhelfer – {tab}" if i == 0 else "\u200b", value=value, inline=False)
 
-        if tab == "overview":
-            pass
-        elif tab == "normal":
-            e.add_field(name="Muhhelfer – normal", value=("\n".join(f"{_status_icon(m)} {m.mention}" for m in normal) if normal else "– aktuell niemand –"), inline=False)
-        elif tab == "schwer":
-            e.add_field(name="Muhhelfer – schwer", value=("\n".join(f"{_status_icon(m)} {m.mention}" for m in schwer) if schwer else "– aktuell niemand –"), inline=False)
-
-        e.set_footer(text=f"Letzte Aktualisierung: {self._now_str()}")
+        self._footer(e, f"Letzte Aktualisierung: {self._now_str()}", page, len(field_pages))
         e.timestamp = discord.utils.utcnow()
         return e
 
@@ -255,7 +508,13 @@ class TriggerPost(commands.Cog):
                     "°muhhelfer intro <text|clear>\n"
                     "°muhhelfer autodelete <min>\n"
                     "°muhhelfer forceping on|off\n"
-                    "°muhhelfer autorefresh <sek|off>\n"
+                    "°muhhelfer autorefresh <sek|adaptive min max|off>\n"
+                    "°muhhelfer pushrefresh <sek|off>\n"
+                    "°muhhelfer lazymembers on|off\n"
+                    "°muhhelfer targets add|remove|list\n"
+                    "°muhhelfer settings\n"
+                    "°muhhelfer stats [prom]\n"
+                    "°muhhelfer record start|stop\n"
                     "```"
                 ),
                 inline=False,
@@ -264,7 +523,18 @@ class TriggerPost(commands.Cog):
         e.timestamp = discord.utils.utcnow()
         return e
 
+    async def _render_layout(self, guild: discord.Guild, layout: str, author: discord.Member, page: int = 1, tab: str = "overview"):
+        """(Intro, Embed, View) eines auto-refreshbaren Layouts; die Bodies kommen aus _cached_body."""
+        if layout == "main":
+            return f"{EMOJI_TITLE} Muhhelfer – Übersicht:", await self._embed_main(guild, author, page=page), self._views["ping"]
+        if layout == "columns":
+            return f"{EMOJI_TITLE} Muhhelfer – Spaltenansicht:", await self._embed_columns(guild, author, page=page), self._views["columns"]
+        has_link = layout == "dashboard_role" and bool(self._conf(guild.id).get("rolesource_url"))
+        view = self._views["dashboard_role" if has_link else "dashboard"]
+        return f"{EMOJI_TITLE} Muhhelfer – Dashboard:", await self._embed_dashboard(guild, tab, page=page), view
+
     # ====== Post/Edit Helper ======
+    @_timed("post_or_edit")
     async def _post_or_edit(
         self,
         channel,
@@ -289,30 +559,51 @@ class TriggerPost(commands.Cog):
 
         # Zielchannel: alte identische Posts löschen (sauber halten)
         if is_target and cleanup_in_target and identifier_for_cleanup:
-            async for m in channel.history(limit=500):
-                if m.author == self.bot.user and identifier_for_cleanup in (m.content or ""):
-                    try:
-                        await m.delete()
-                    except discord.Forbidden:
-                        pass
-
-        # Versuche zu editieren, wenn msg_id existiert
-        if msg_id and is_target:
+            removed = await self._cleanup_overviews(channel, identifier_for_cleanup)
+            if msg_id and int(msg_id) in removed:
+                self._dead_targets.add(channel.guild.id)
+
+        # Versuche zu editieren, wenn msg_id existiert (direkt über PartialMessage, ohne fetch)
+        if msg_id and is_target and channel.guild.id not in self._dead_targets:
+            handle = self._target_handle(channel, msg_id)
+            payload, hashes = self._edit_payload(handle.id, content, embed, view, self._target_views.get(channel.guild.id))
+            if not payload:
+                if not allow_create_if_missing:
+                    self._metrics.inc("edit_skipped_total", reason="same_render")
+                    return handle
+                # Trigger/post/refresh: mindestens das Embed schicken, sonst fällt eine gelöschte
+                # Zielnachricht nie per NotFound auf und es wird nie neu gepostet
+                payload = {"embed": embed}
             try:
-                old = await channel.fetch_message(int(msg_id))
-                await old.edit(content=content, embed=embed, view=view)
-                return old
-            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                msg = await self._edits.submit(handle, **payload)
+                self._sent_hashes[handle.id] = hashes
+                if view is not None:
+                    self._target_views[channel.guild.id] = view
+                return msg
+            except discord.NotFound:
+                self._metrics.inc("edit_failed_total", reason="not_found")
+                self._dead_targets.add(channel.guild.id)
+                if not allow_create_if_missing:
+                    raise
+            except (discord.Forbidden, discord.HTTPException) as e:
+                self._metrics.inc("edit_failed_total", reason=str(getattr(e, "status", "http")))
+                if getattr(e, "status", None) == 429:
+                    self._metrics.inc("http_429_total")
                 if not allow_create_if_missing:
                     # Keine Neuerstellung gewünscht → nichts tun
                     raise
 
         # Falls Neuanlage erlaubt (z. B. manuelle Posts/Trigger)
         if allow_create_if_missing:
+            self._metrics.rest("send")
             sent = await channel.send(content=content, embed=embed, view=view)
+            if is_target and identifier_for_cleanup:
+                tracked = self._conf(channel.guild.id)["overview_message_ids"]
+                await self._conf_set(channel.guild.id, "overview_message_ids", tracked + [sent.id])
             # Auto-Delete (nur außerhalb Zielchannel)
             if not is_target and autodelete_after_min and autodelete_after_min > 0:
                 try:
+                    self._metrics.rest("delete")
                     await sent.delete(delay=autodelete_after_min * 60)
                 except Exception:
                     pass
@@ -321,6 +612,111 @@ class TriggerPost(commands.Cog):
         # Nichts getan (Auto-Refresh ohne bestehende Nachricht)
         raise RuntimeError("Auto-Refresh: Zielnachricht existiert nicht; kein Neuerstellen.")
 
+    async def _cleanup_overviews(self, channel, identifier: str) -> set[int]:
+        """Löscht die gemerkten Übersicht-Posts im Zielchannel (Bulk-Delete in 100er-Blöcken).
+        Nur beim ersten Mal wird der Altbestand per History-Scan eingesammelt."""
+        guild_id = channel.guild.id
+        data = self._conf(guild_id)
+        ids = list(data["overview_message_ids"])
+        if not data["overview_ids_migrated"]:
+            scanned = 0
+            async for m in channel.history(limit=500):
+                scanned += 1
+                if m.author == self.bot.user and identifier in (m.content or "") and m.id not in ids:
+                    ids.append(m.id)
+            self._metrics.rest("history", scanned // 100 + 1)
+            await self._conf_set(guild_id, "overview_ids_migrated", True)
+        if not ids:
+            return set()
+
+        cutoff = discord.utils.time_snowflake(discord.utils.utcnow() - BULK_DELETE_MAX_AGE)
+        can_bulk = channel.permissions_for(channel.guild.me).manage_messages
+        bulk = [i for i in ids if i > cutoff] if can_bulk else []
+        single = [i for i in ids if i not in bulk]
+        for start in range(0, len(bulk), 100):
+            chunk = bulk[start:start + 100]
+            self._metrics.rest("bulk_delete" if len(chunk) > 1 else "delete")
+            try:
+                await channel.delete_messages([discord.Object(id=i) for i in chunk])
+            except discord.HTTPException:
+                single.extend(chunk)  # z. B. bereits gelöschte IDs im Block → einzeln nachziehen
+        for i in single:
+            self._metrics.rest("delete")
+            try:
+                await channel.get_partial_message(i).delete()
+            except discord.HTTPException:
+                pass  # schon weg oder keine Rechte
+
+        # während der Deletes neu gepostete Übersichten (z. B. Admin ohne Cooldown) nicht vergessen
+        removed = set(ids)
+        remaining = [i for i in self._conf(guild_id)["overview_message_ids"] if i not in removed]
+        await self._conf_set(guild_id, "overview_message_ids", remaining)
+        return removed
+
+    async def _edit_overview(self, channel, message_id: int, content: str, embed: discord.Embed, view: ui.View):
+        """Weitere Übersicht editieren – nie neu posten. Fehlt die Nachricht, ruht sie bis zur
+        nächsten Änderung an overview_targets."""
+        payload, hashes = self._edit_payload(message_id, content, embed, view, self._overview_views.get(message_id))
+        if not payload:
+            self._metrics.inc("edit_skipped_total", reason="same_render")
+            return
+        try:
+            await self._edits.submit(channel.get_partial_message(message_id), **payload)
+        except discord.NotFound:
+            self._metrics.inc("edit_failed_total", reason="not_found")
+            self._dead_overviews.add(message_id)
+            raise
+        except discord.HTTPException as e:
+            self._metrics.inc("edit_failed_total", reason=str(e.status))
+            if e.status == 429:
+                self._metrics.inc("http_429_total")
+            raise
+        self._sent_hashes[message_id] = hashes
+        self._overview_views[message_id] = view
+
+    def _edit_payload(self, message_id: int, content: str, embed: discord.Embed, view: Optional[ui.View], current_view):
+        """Nur die Teile mitschicken, die sich gegenüber dem letzten Edit dieser Nachricht geändert
+        haben (Footer/Zeitstempel zählen nicht). Leeres Payload → Edit überspringen."""
+        hashes = (_digest(content), _embed_digest(embed))
+        sent_content, sent_embed = self._sent_hashes.get(message_id, (None, None))
+        payload = {}
+        if hashes[0] != sent_content:
+            payload["content"] = content
+        if hashes[1] != sent_embed:
+            payload["embed"] = embed
+        if view is not None and current_view is not view:
+            payload["view"] = view  # Komponenten nur mitschicken, wenn sie sich ändern
+        return payload, hashes
+
+    def _remember_page(self, message_id: int, page: int):
+        """Gewählte Seite für den Auto-Refresh merken (nur Abweichungen von Seite 1)."""
+        if page > 1:
+            self._pages[message_id] = page
+        else:
+            self._pages.pop(message_id, None)
+
+    def _remember_tab(self, message_id: int, tab: str):
+        """Gewählten Dashboard-Tab für den Auto-Refresh merken (nur Abweichungen von der Übersicht)."""
+        if tab != "overview":
+            self._tabs[message_id] = tab
+        else:
+            self._tabs.pop(message_id, None)
+
+    async def _edit_interaction_message(self, interaction: discord.Interaction, **payload):
+        """Button-Klick ist bereits per defer() bestätigt; der eigentliche Edit läuft über den Coalescer."""
+        try:
+            await self._edits.submit(interaction.message, **payload)
+        except discord.HTTPException as e:
+            self._metrics.inc("edit_failed_total", reason=str(e.status))
+            if e.status == 429:
+                self._metrics.inc("http_429_total")
+            self._sent_hashes.pop(interaction.message.id, None)
+            return
+        sent = self._sent_hashes.get(interaction.message.id)
+        if sent is not None and "embed" in payload:
+            # Button-Edits (Seite/Tab) ändern den Stand, den der Auto-Refresh vergleicht
+            self._sent_hashes[interaction.message.id] = (sent[0], _embed_digest(payload["embed"]))
+
     # ====== VIEWS ======
     class PingView(ui.View):
         def __init__(self, parent: "TriggerPost"):
@@ -340,12 +736,35 @@ class TriggerPost(commands.Cog):
             guild = interaction.guild
             if not guild:
                 return await interaction.response.send_message("⚠️ Nur im Server.", ephemeral=True)
+            await interaction.response.defer()
+            embed = await self._render(interaction, page_of(interaction.message)[0])
+            await self.parent._edit_interaction_message(interaction, embed=embed)
+
+        @ui.button(label="◀", style=discord.ButtonStyle.secondary, custom_id="muh_page_prev")
+        async def page_prev(self, interaction: discord.Interaction, _button: ui.Button):
+            await self._turn(interaction, -1)
+
+        @ui.button(label="▶", style=discord.ButtonStyle.secondary, custom_id="muh_page_next")
+        async def page_next(self, interaction: discord.Interaction, _button: ui.Button):
+            await self._turn(interaction, +1)
+
+        async def _render(self, interaction: discord.Interaction, page: int) -> discord.Embed:
             title = interaction.message.embeds[0].title if interaction.message.embeds else ""
             if "Spaltenansicht" in (title or ""):
-                embed = await self.parent._embed_columns(guild, interaction.user)
-            else:
-                embed = await self.parent._embed_main(guild, interaction.user)
-            await interaction.response.edit_message(embed=embed, view=self)
+                return await self.parent._embed_columns(interaction.guild, interaction.user, page=page)
+            return await self.parent._embed_main(interaction.guild, interaction.user, page=page)
+
+        async def _turn(self, interaction: discord.Interaction, step: int):
+            if not interaction.guild:
+                return await interaction.response.send_message("⚠️ Nur im Server.", ephemeral=True)
+            page, pages = page_of(interaction.message)
+            if pages <= 1:
+                return await interaction.response.send_message("ℹ️ Alle Muhhelfer passen auf eine Seite.", ephemeral=True)
+            await interaction.response.defer()
+            page = (page - 1 + step) % pages + 1
+            self.parent._remember_page(interaction.message.id, page)
+            embed = await self._render(interaction, page)
+            await self.parent._edit_interaction_message(interaction, embed=embed)
 
     class ColumnsView(PingView):
         pass
@@ -355,7 +774,20 @@ class TriggerPost(commands.Cog):
             super().__init__(timeout=None)
             self.parent = parent
             self.with_role_button = with_role_button
-            self.current_tab = "overview"
+            for child in self.children:
+                if isinstance(child, ui.Button) and child.custom_id == "muh_dash_rolebtn":
+                    child.disabled = not with_role_button
+
+        @staticmethod
+        def _tab_of(message: Optional[discord.Message]) -> str:
+            """Aktiver Tab steht im Embed der Nachricht (die View wird von allen Dashboards geteilt)."""
+            if message and message.embeds:
+                for field in message.embeds[0].fields:
+                    if field.name == "Muhhelfer – normal":
+                        return "normal"
+                    if field.name == "Muhhelfer – schwer":
+                        return "schwer"
+            return "overview"
 
         @ui.button(label="Übersicht", style=discord.ButtonStyle.secondary, custom_id="muh_tab_overview")
         async def tab_overview(self, interaction: discord.Interaction, _button: ui.Button):
@@ -373,19 +805,21 @@ class TriggerPost(commands.Cog):
             guild = interaction.guild
             if not guild:
                 return await interaction.response.send_message("⚠️ Nur im Server.", ephemeral=True)
-            self.current_tab = tab
+            await interaction.response.defer()
+            self.parent._remember_page(interaction.message.id, 1)
+            self.parent._remember_tab(interaction.message.id, tab)
             embed = await self.parent._embed_dashboard(guild, tab)
-            await interaction.response.edit_message(embed=embed, view=self)
+            await self.parent._edit_interaction_message(interaction, embed=embed)
 
         @ui.button(label="Normal pingen", style=discord.ButtonStyle.primary, emoji=EMOJI_NORMAL, custom_id="muh_dash_ping_normal")
         async def dash_ping_normal(self, interaction: discord.Interaction, _button: ui.Button):
-            if self.current_tab != "normal":
+            if self._tab_of(interaction.message) != "normal":
                 return await interaction.response.send_message("ℹ️ Öffne zuerst den **Normal**-Tab.", ephemeral=True)
             await self.parent._handle_ping_button(interaction, ROLE_NORMAL)
 
         @ui.button(label="Schwer pingen", style=discord.ButtonStyle.danger, emoji=EMOJI_SCHWER, custom_id="muh_dash_ping_schwer")
         async def dash_ping_schwer(self, interaction: discord.Interaction, _button: ui.Button):
-            if self.current_tab != "schwer":
+            if self._tab_of(interaction.message) != "schwer":
                 return await interaction.response.send_message("ℹ️ Öffne zuerst den **Schwer**-Tab.", ephemeral=True)
             await self.parent._handle_ping_button(interaction, ROLE_SCHWER)
 
@@ -394,36 +828,54 @@ class TriggerPost(commands.Cog):
             guild = interaction.guild
             if not guild:
                 return await interaction.response.send_message("⚠️ Nur im Server.", ephemeral=True)
-            embed = await self.parent._embed_dashboard(guild, self.current_tab)
-            await interaction.response.edit_message(embed=embed, view=self)
+            await interaction.response.defer()
+            page = page_of(interaction.message)[0]
+            embed = await self.parent._embed_dashboard(guild, self._tab_of(interaction.message), page=page)
+            await self.parent._edit_interaction_message(interaction, embed=embed)
+
+        @ui.button(label="◀", style=discord.ButtonStyle.secondary, custom_id="muh_dash_page_prev")
+        async def dash_page_prev(self, interaction: discord.Interaction, _button: ui.Button):
+            await self._turn(interaction, -1)
+
+        @ui.button(label="▶", style=discord.ButtonStyle.secondary, custom_id="muh_dash_page_next")
+        async def dash_page_next(self, interaction: discord.Interaction, _button: ui.Button):
+            await self._turn(interaction, +1)
+
+        async def _turn(self, interaction: discord.Interaction, step: int):
+            guild = interaction.guild
+            if not guild:
+                return await interaction.response.send_message("⚠️ Nur im Server.", ephemeral=True)
+            page, pages = page_of(interaction.message)
+            if pages <= 1:
+                return await interaction.response.send_message("ℹ️ Alle Muhhelfer passen auf eine Seite.", ephemeral=True)
+            await interaction.response.defer()
+            page = (page - 1 + step) % pages + 1
+            self.parent._remember_page(interaction.message.id, page)
+            embed = await self.parent._embed_dashboard(guild, self._tab_of(interaction.message), page=page)
+            await self.parent._edit_interaction_message(interaction, embed=embed)
 
         @ui.button(label="Rolle holen", style=discord.ButtonStyle.success, custom_id="muh_dash_rolebtn")
         async def role_button(self, interaction: discord.Interaction, _button: ui.Button):
             if not self.with_role_button:
                 return await interaction.response.send_message("ℹ️ Kein Rollen-Link hinterlegt.", ephemeral=True)
-            data = await self.parent.config.guild(interaction.guild).all()
-            link = data.get("rolesource_url")
+            link = self.parent._conf(interaction.guild.id).get("rolesource_url")
             if not link:
                 return await interaction.response.send_message("ℹ️ Kein Rollen-Link hinterlegt.", ephemeral=True)
             await interaction.response.send_message(f"🔗 Rollen holen: {link}", ephemeral=True)
 
-        async def interaction_check(self, interaction: discord.Interaction) -> bool:
-            for child in self.children:
-                if isinstance(child, ui.Button) and child.custom_id == "muh_dash_rolebtn":
-                    child.disabled = not self.with_role_button
-            return True
-
     class CommandsView(ui.View):
-        def __init__(self, parent: "TriggerPost", show_admin: bool = False):
+        def __init__(self, parent: "TriggerPost"):
             super().__init__(timeout=None)
             self.parent = parent
-            self.show_admin = show_admin
+
+        @staticmethod
+        def _admin_shown(message: Optional[discord.Message]) -> bool:
+            return bool(message and message.embeds and any(f.name == "Admin" for f in message.embeds[0].fields))
 
         @ui.button(label="Admin anzeigen/ausblenden", style=discord.ButtonStyle.secondary, custom_id="muh_cmd_toggle_admin")
         async def toggle_admin(self, interaction: discord.Interaction, _button: ui.Button):
-            embed = await self.parent._embed_commands(not self.show_admin)
-            self.show_admin = not self.show_admin
-            await interaction.response.edit_message(embed=embed, view=self)
+            embed = await self.parent._embed_commands(not self._admin_shown(interaction.message))
+            await interaction.response.edit_message(embed=embed)
 
         @ui.button(label="Alle Befehle (kopieren)", style=discord.ButtonStyle.primary, custom_id="muh_cmd_copy_all")
         async def copy_all(self, interaction: discord.Interaction, _button: ui.Button):
@@ -433,7 +885,7 @@ class TriggerPost(commands.Cog):
                 "**Offizier / Admin**\n"
                 "```\n°muhhelfer addtrigger <text>\n°muhhelfer removetrigger <text>\n°muhhelfer list\n°muhhelfer refresh\n```\n"
                 "**Admin**\n"
-                "```\n°muhhelfer setchannel #channel\n°muhhelfer setmessage <id>\n°muhhelfer cooldown <sek>\n°muhhelfer intro <text|clear>\n°muhhelfer autodelete <min>\n°muhhelfer forceping on|off\n°muhhelfer autorefresh <sek|off>\n```"
+                "```\n°muhhelfer setchannel #channel\n°muhhelfer setmessage <id>\n°muhhelfer cooldown <sek>\n°muhhelfer intro <text|clear>\n°muhhelfer autodelete <min>\n°muhhelfer forceping on|off\n°muhhelfer autorefresh <sek|adaptive min max|off>\n°muhhelfer pushrefresh <sek|off>\n°muhhelfer lazymembers on|off\n°muhhelfer targets add|remove|list\n°muhhelfer settings\n°muhhelfer stats [prom]\n°muhhelfer record start|stop\n```"
             )
             await interaction.response.send_message(txt, ephemeral=True)
 
@@ -447,7 +899,7 @@ class TriggerPost(commands.Cog):
     async def manual_post(self, ctx: commands.Context, minutes: Optional[int] = None):
         guild = ctx.guild
         author = ctx.author
-        data = await self.config.guild(guild).all()
+        data = self._conf(guild.id)
         target_id = data["target_channel_id"]
         if not target_id:
             return await ctx.send("⚠️ Kein Ziel-Channel gesetzt.")
@@ -458,13 +910,9 @@ class TriggerPost(commands.Cog):
             target = guild.get_channel(target_id)
             return await ctx.send(f"⚠️ Bitte nutze den Befehl im {target.mention}.", delete_after=5)
 
-        now = time.time()
-        until = self._cooldown_until.get(ctx.channel.id, 0)
         if not (is_admin or is_offi):
-            cd = (await self.config.guild(guild).cooldown_seconds())
-            if now < until:
+            if self._cooldowns.hit(("post", ctx.channel.id), data["cooldown_seconds"]):
                 return
-            self._cooldown_until[ctx.channel.id] = now + cd
 
         is_target = ctx.channel.id == target_id
         autodelete_conf = int(data.get("autodelete_minutes") or 0)
@@ -484,7 +932,7 @@ class TriggerPost(commands.Cog):
 
         embed = await self._embed_main(guild, author, manual_info=manual_info, footer_note=footer_note)
         intro = (f"{data.get('intro_text')}\n\n{EMOJI_TITLE} Muhhelfer – Übersicht:" if data.get("intro_text") else f"{EMOJI_TITLE} Muhhelfer – Übersicht:")
-        view = self.PingView(self)
+        view = self._views["ping"]
         await self._post_or_edit(
             ctx.channel, embed, data["message_id"],
             target_id=target_id, autodelete_after_min=autodel, view=view,
@@ -503,10 +951,11 @@ class TriggerPost(commands.Cog):
         phrase = (phrase or "").strip().casefold()
         if not phrase:
             return await ctx.send("⚠️ Leerer Trigger ist nicht erlaubt.")
-        async with self.config.guild(ctx.guild).triggers() as t:
-            if phrase in t:
-                return await ctx.send("⚠️ Dieser Trigger existiert bereits.")
-            t.append(phrase)
+        triggers = list(self._conf(ctx.guild.id)["triggers"])
+        if phrase in triggers:
+            return await ctx.send("⚠️ Dieser Trigger existiert bereits.")
+        triggers.append(phrase)
+        await self._conf_set(ctx.guild.id, "triggers", triggers)
         await ctx.send(f"✅ Trigger hinzugefügt: `{phrase}`")
 
     @muhhelfer.command(name="removetrigger")
@@ -517,10 +966,11 @@ class TriggerPost(commands.Cog):
         if not (is_admin or is_offi):
             return await ctx.send("🚫 Du darfst diesen Befehl nicht verwenden.")
         phrase = (phrase or "").strip().casefold()
-        async with self.config.guild(ctx.guild).triggers() as t:
-            if phrase not in t:
-                return await ctx.send("⚠️ Trigger nicht gefunden.")
-            t.remove(phrase)
+        triggers = list(self._conf(ctx.guild.id)["triggers"])
+        if phrase not in triggers:
+            return await ctx.send("⚠️ Trigger nicht gefunden.")
+        triggers.remove(phrase)
+        await self._conf_set(ctx.guild.id, "triggers", triggers)
         await ctx.send(f"🗑️ Trigger entfernt: `{phrase}`")
 
     @muhhelfer.command(name="list")
@@ -530,9 +980,9 @@ class TriggerPost(commands.Cog):
         is_offi = any(r.id == ROLE_OFFIZIERE_BYPASS for r in author.roles)
         if not (is_admin or is_offi):
             e = await self._embed_commands(False)
-            return await ctx.send(embed=e, view=self.CommandsView(self, show_admin=False))
+            return await ctx.send(embed=e, view=self._views["commands"])
         e = await self._embed_commands(False)
-        await ctx.send(embed=e, view=self.CommandsView(self, show_admin=False))
+        await ctx.send(embed=e, view=self._views["commands"])
 
     @muhhelfer.command(name="refresh")
     async def refresh_list(self, ctx: commands.Context):
@@ -541,13 +991,13 @@ class TriggerPost(commands.Cog):
         is_offi = any(r.id == ROLE_OFFIZIERE_BYPASS for r in author.roles)
         if not (is_admin or is_offi):
             return await ctx.send("🚫 Du darfst diesen Befehl nicht verwenden.")
-        data = await self.config.guild(ctx.guild).all()
+        data = self._conf(ctx.guild.id)
         target_id = data["target_channel_id"]
         if not target_id:
             return await ctx.send("⚠️ Kein Ziel-Channel gesetzt.")
         channel = ctx.guild.get_channel(target_id)
         embed = await self._embed_main(ctx.guild, ctx.author)
-        view = self.PingView(self)
+        view = self._views["ping"]
         await self._post_or_edit(
             channel, embed, data["message_id"],
             target_id=target_id, view=view,
@@ -557,6 +1007,237 @@ class TriggerPost(commands.Cog):
         )
         await ctx.send("✅ Muhhelfer-Liste aktualisiert.", delete_after=5)
 
+    # ====== Admin-Einstellungen ======
+    @muhhelfer.command(name="setchannel")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_channel(self, ctx: commands.Context, channel: discord.TextChannel):
+        await self._conf_set(ctx.guild.id, "target_channel_id", channel.id)
+        await ctx.send(f"✅ Ziel-Channel gesetzt: {channel.mention}")
+
+    @muhhelfer.command(name="setmessage")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_message(self, ctx: commands.Context, message_id: int):
+        await self._conf_set(ctx.guild.id, "message_id", message_id)
+        await ctx.send(f"✅ Ziel-Nachricht gesetzt: `{message_id}`")
+
+    @muhhelfer.command(name="cooldown")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_cooldown(self, ctx: commands.Context, seconds: int):
+        if seconds < 0 or seconds > 3600:
+            return await ctx.send("⚠️ Bitte Sekunden zwischen 0 und 3600 angeben.")
+        await self._conf_set(ctx.guild.id, "cooldown_seconds", seconds)
+        await ctx.send(f"✅ Cooldown: **{seconds}s**")
+
+    @muhhelfer.command(name="intro")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_intro(self, ctx: commands.Context, *, text: str):
+        text = text.strip()
+        if text.lower() == "clear":
+            await self._conf_set(ctx.guild.id, "intro_text", None)
+            return await ctx.send("🧹 Intro-Text gelöscht.")
+        await self._conf_set(ctx.guild.id, "intro_text", text)
+        await ctx.send("✅ Intro-Text gesetzt.")
+
+    @muhhelfer.command(name="autodelete")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_autodelete(self, ctx: commands.Context, minutes: int):
+        if minutes < 0 or minutes > 1440:
+            return await ctx.send("⚠️ Bitte Minuten zwischen 0 und 1440 angeben.")
+        await self._conf_set(ctx.guild.id, "autodelete_minutes", minutes)
+        await ctx.send(f"✅ Auto-Delete: **{minutes} Min**" if minutes else "✅ Auto-Delete deaktiviert.")
+
+    @muhhelfer.command(name="forceping")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_forceping(self, ctx: commands.Context, state: str):
+        state = state.lower()
+        if state not in ("on", "off"):
+            return await ctx.send("ℹ️ Nutzung: `°muhhelfer forceping on|off`")
+        await self._conf_set(ctx.guild.id, "force_role_ping", state == "on")
+        await ctx.send(f"✅ Force-Ping: **{state}**")
+
+    @muhhelfer.command(name="lazymembers")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_lazymembers(self, ctx: commands.Context, state: str):
+        """Nur die bekannten Muhhelfer gezielt nachladen (bis dahin aus dem Roster-Snapshot rendern);
+        neue Rolleninhaber findet ein Chunk der Guild im Hintergrund.
+
+        Bringt nur etwas, wenn der Bot ohne Chunking beim Start läuft; Red lädt Guilds standardmäßig
+        schon beim Verbinden vollständig, dann ist der Modus wirkungslos."""
+        state = state.lower()
+        if state not in ("on", "off"):
+            return await ctx.send("ℹ️ Nutzung: `°muhhelfer lazymembers on|off`")
+        await self._conf_set(ctx.guild.id, "lazy_members", state == "on")
+        if state == "on":
+            self._snapshot_sigs.pop(ctx.guild.id, None)  # beim nächsten Flush Snapshot schreiben
+            self._maybe_warm(ctx.guild)
+        else:
+            self._snapshots.discard(ctx.guild.id)
+        note = " (Guild ist bereits vollständig geladen – greift erst beim nächsten Start ohne Chunking)" if state == "on" and ctx.guild.chunked else ""
+        await ctx.send(f"✅ Lazy-Members: **{state}**{note}")
+
+    @muhhelfer.command(name="pushrefresh")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_pushrefresh(self, ctx: commands.Context, value: str):
+        """Übersicht bei Roster-Änderungen nach kurzer Ruhe editieren, höchstens alle <sek>."""
+        if value.lower() == "off":
+            seconds = 0
+        elif value.isdigit() and int(value) >= PUSH_MIN_INTERVAL:
+            seconds = int(value)
+        else:
+            return await ctx.send(f"ℹ️ Nutzung: `°muhhelfer pushrefresh <sek|off>` (mindestens {PUSH_MIN_INTERVAL}s)")
+        await self._conf_set(ctx.guild.id, "push_min_interval", seconds)
+        await ctx.send(f"✅ Push-Refresh: höchstens alle **{seconds}s**" if seconds else "✅ Push-Refresh deaktiviert.")
+
+    @muhhelfer.command(name="autorefresh")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_autorefresh(self, ctx: commands.Context, value: Optional[str] = None, low: Optional[int] = None, high: Optional[int] = None):
+        """Festes Intervall, `adaptive <min> <max>` (folgt der Roster-Änderungsrate) oder `off`.
+        Ohne Argument: aktueller Stand."""
+        guild_id = ctx.guild.id
+        if value is None:
+            return await ctx.send(f"ℹ️ {self._autorefresh_status(guild_id)}")
+        value = value.lower()
+        if value == "adaptive":
+            if low is None or high is None or low < 10 or high <= low:
+                return await ctx.send("ℹ️ Nutzung: `°muhhelfer autorefresh adaptive <min> <max>` (min ≥ 10s, max > min)")
+            await self._conf_set(guild_id, "auto_refresh_adaptive", [low, high])
+            seconds = high
+        elif value == "off":
+            seconds = 0
+        elif value.isdigit() and int(value) >= 10:
+            seconds = int(value)
+        else:
+            return await ctx.send("ℹ️ Nutzung: `°muhhelfer autorefresh <sek|adaptive min max|off>` (mindestens 10s)")
+        if value != "adaptive" and self._conf(guild_id).get("auto_refresh_adaptive"):
+            await self._conf_set(guild_id, "auto_refresh_adaptive", [])
+        await self._conf_set(guild_id, "auto_refresh_seconds", seconds)
+        await ctx.send(f"✅ {self._autorefresh_status(guild_id)}")
+
+    @muhhelfer.command(name="settings")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def show_settings(self, ctx: commands.Context):
+        """Aktuelle Einstellungen inkl. effektivem Auto-Refresh-Intervall und Roster-Churn."""
+        data = self._conf(ctx.guild.id)
+        target = data.get("target_channel_id")
+        push = int(data.get("push_min_interval") or 0)
+        lines = [
+            f"Ziel-Channel: {f'<#{target}>' if target else '—'} • Nachricht: `{data.get('message_id') or '—'}`",
+            f"Weitere Übersichten: {len(data.get('overview_targets') or [])}",
+            f"Cooldown: {data['cooldown_seconds']}s • Auto-Delete: {data['autodelete_minutes']} Min • "
+            f"Force-Ping: {'on' if data['force_role_ping'] else 'off'}",
+            self._autorefresh_status(ctx.guild.id),
+            f"Push-Refresh: {f'höchstens alle {push}s' if push else 'aus'} • "
+            f"Lazy-Members: {'on' if data.get('lazy_members') else 'off'}",
+        ]
+        await ctx.send("**TriggerPost – Einstellungen**\n" + "\n".join(lines))
+
+    # ====== Weitere Übersichten (Auto-Refresh) ======
+    @muhhelfer.group(name="targets")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def targets(self, ctx: commands.Context):
+        pass
+
+    @targets.command(name="add")
+    async def targets_add(self, ctx: commands.Context, channel: discord.TextChannel, layout: str, message_id: Optional[int] = None):
+        """Weitere Übersicht anlegen (ohne ID wird sie in #channel gepostet) – wird mit auto-refresht."""
+        layout = OVERVIEW_LAYOUTS.get(layout.lower())
+        if layout is None:
+            return await ctx.send("ℹ️ Nutzung: `°muhhelfer targets add #channel <main|layout1|layout2|layout3> [message_id]`")
+        targets = list(self._conf(ctx.guild.id)["overview_targets"])
+        if message_id and any(t["message_id"] == message_id for t in targets):
+            return await ctx.send("⚠️ Diese Nachricht ist bereits eingetragen.")
+        if len(targets) >= MAX_OVERVIEW_TARGETS:
+            return await ctx.send(f"⚠️ Maximal {MAX_OVERVIEW_TARGETS} weitere Übersichten pro Server.")
+
+        intro, embed, view = await self._render_layout(ctx.guild, layout, ctx.author)
+        try:
+            if message_id:
+                await self._edit_overview(channel, message_id, intro, embed, view)
+            else:
+                self._metrics.rest("send")
+                message_id = (await channel.send(content=intro, embed=embed, view=view)).id
+                self._overview_views[message_id] = view
+        except discord.HTTPException:
+            return await ctx.send("⚠️ Nachricht nicht gefunden oder keine Rechte (nur eigene Bot-Nachrichten editierbar).")
+        targets.append({"channel_id": channel.id, "message_id": message_id, "layout": layout})
+        await self._conf_set(ctx.guild.id, "overview_targets", targets)
+        await ctx.send(f"✅ Übersicht `{message_id}` ({layout}) in {channel.mention} eingetragen.")
+
+    @targets.command(name="remove")
+    async def targets_remove(self, ctx: commands.Context, message_id: int):
+        targets = self._conf(ctx.guild.id)["overview_targets"]
+        kept = [t for t in targets if t["message_id"] != message_id]
+        if len(kept) == len(targets):
+            return await ctx.send("⚠️ Diese Nachricht ist nicht eingetragen.")
+        self._overview_views.pop(message_id, None)
+        self._dead_overviews.discard(message_id)
+        await self._conf_set(ctx.guild.id, "overview_targets", kept)
+        await ctx.send(f"🗑️ Übersicht `{message_id}` entfernt (die Nachricht selbst bleibt stehen).")
+
+    @targets.command(name="list")
+    async def targets_list(self, ctx: commands.Context):
+        targets = self._conf(ctx.guild.id)["overview_targets"]
+        if not targets:
+            return await ctx.send("ℹ️ Keine weiteren Übersichten eingetragen.")
+        lines = []
+        for t in targets:
+            state = " – ⚠️ Nachricht fehlt" if t["message_id"] in self._dead_overviews else ""
+            lines.append(f"• <#{t['channel_id']}> `{t['message_id']}` ({t['layout']}){state}")
+        await ctx.send("**Weitere Übersichten:**\n" + "\n".join(lines))
+
+    # ====== Statistik ======
+    @muhhelfer.command(name="stats")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def stats(self, ctx: commands.Context, fmt: str = None):
+        """Latenzen, REST-Aufrufe, 429er und Refresh-Zähler. `prom` liefert das Prometheus-Textformat."""
+        if (fmt or "").lower() == "prom":
+            data = self._metrics.prometheus().encode("utf-8")
+            return await ctx.send(file=discord.File(io.BytesIO(data), filename="triggerpost_metrics.txt"))
+        m = self._metrics
+        head = [
+            f"REST gesamt: {m.counter_total('rest_calls_total')} • 429: {m.counter_total('http_429_total')} "
+            f"(prozessweit geloggt: {m.counter_total('http_429_logged_total')}) • "
+            f"Edits fehlgeschlagen: {m.counter_total('edit_failed_total')} • "
+            f"Refresh übersprungen: {m.counter_total('refresh_skipped_total')} • "
+            f"Config-I/O: {m.counter_total('config_io_total')}",
+            "",
+        ]
+        text = "\n".join(head + m.summary_lines())
+        if len(text) > 1900:
+            text = text[:1900] + "\n… (gekürzt, vollständig: °muhhelfer stats prom)"
+        await ctx.send(f"```\n{text}\n```")
+
+    # ====== Aufzeichnung (für python -m triggerpost.replay) ======
+    @muhhelfer.group(name="record")
+    @commands.admin_or_permissions(manage_guild=True)
+    async def record(self, ctx: commands.Context):
+        """Roster-relevante Gateway-Events dieser Guild als JSONL mitschreiben (Offline-Replay)."""
+
+    @record.command(name="start")
+    async def record_start(self, ctx: commands.Context):
+        if ctx.guild.id in self._recorders:
+            return await ctx.send("⚠️ Es läuft bereits eine Aufzeichnung. Beenden mit `°muhhelfer record stop`.")
+        folder = cog_data_path(self) / "recordings"
+        await asyncio.to_thread(folder.mkdir, parents=True, exist_ok=True)
+        path = folder / f"{ctx.guild.id}-{datetime.now():%Y%m%d-%H%M%S}.jsonl"
+        recorder = EventRecorder(path, (ROLE_NORMAL, ROLE_SCHWER), self._conf(ctx.guild.id).get("target_channel_id"))
+        holders = recorder.start(ctx.guild)
+        self._recorders[ctx.guild.id] = recorder
+        note = "" if self._roster_loaded(ctx.guild) else "\n⚠️ Muhhelfer noch nicht vollständig geladen – der Startstand ist unvollständig."
+        await ctx.send(f"⏺️ Aufzeichnung gestartet ({holders} Muhhelfer): `{path.name}`{note}")
+
+    @record.command(name="stop")
+    async def record_stop(self, ctx: commands.Context):
+        recorder = self._recorders.pop(ctx.guild.id, None)
+        if recorder is None:
+            return await ctx.send("ℹ️ Keine laufende Aufzeichnung.")
+        await recorder.save()  # wartet einen laufenden Snapshot-Schreibvorgang ab
+        await ctx.send(
+            f"⏹️ Aufzeichnung beendet: **{recorder.count}** Events"
+            + (" (Limit erreicht, Rest verworfen)" if recorder.truncated else "")
+            + f"\nDatei: `{recorder.path}`\nOffline abspielen: `python -m triggerpost.replay {recorder.path.name}`"
+        )
+
     # ====== Role-Source ======
     @muhhelfer.group(name="rolesource")
     @commands.admin_or_permissions(manage_guild=True)
@@ -570,17 +1251,17 @@ class TriggerPost(commands.Cog):
         url_match = re.match(r"https?://", link_or_mention)
         if not (chan_match or url_match):
             return await ctx.send("⚠️ Bitte eine Nachrichten-URL oder Channel-Mention/Link angeben.")
-        await self.config.guild(ctx.guild).rolesource_url.set(link_or_mention)
+        await self._conf_set(ctx.guild.id, "rolesource_url", link_or_mention)
         await ctx.send(f"✅ Rollen-Quelle gesetzt: {link_or_mention}")
 
     @rolesource.command(name="show")
     async def rolesource_show(self, ctx: commands.Context):
-        link = await self.config.guild(ctx.guild).rolesource_url()
+        link = self._conf(ctx.guild.id)["rolesource_url"]
         await ctx.send(f"🔗 Rollen-Quelle: {link or '— nicht gesetzt —'}")
 
     @rolesource.command(name="clear")
     async def rolesource_clear(self, ctx: commands.Context):
-        await self.config.guild(ctx.guild).rolesource_url.set(None)
+        await self._conf_set(ctx.guild.id, "rolesource_url", None)
         await ctx.send("🧹 Rollen-Quelle gelöscht.")
 
     # ====== TEST-LAYOUTS ======
@@ -591,7 +1272,7 @@ class TriggerPost(commands.Cog):
     @test_layouts.command(name="layout1")
     async def test_layout1(self, ctx: commands.Context, minutes: Optional[int] = None):
         embed = await self._embed_columns(ctx.guild, ctx.author)
-        view = self.ColumnsView(self)
+        view = self._views["columns"]
         await self._post_or_edit(
             ctx.channel, embed, None, target_id=None, autodelete_after_min=minutes, view=view,
             intro_text=f"{EMOJI_TITLE} Muhhelfer – Spaltenansicht:", cleanup_in_target=False
@@ -600,7 +1281,7 @@ class TriggerPost(commands.Cog):
     @test_layouts.command(name="layout2")
     async def test_layout2(self, ctx: commands.Context, minutes: Optional[int] = None):
         embed = await self._embed_dashboard(ctx.guild, "overview")
-        view = self.DashboardView(self, with_role_button=False)
+        view = self._views["dashboard"]
         await self._post_or_edit(
             ctx.channel, embed, None, target_id=None, autodelete_after_min=minutes, view=view,
             intro_text=f"{EMOJI_TITLE} Muhhelfer – Dashboard:", cleanup_in_target=False
@@ -608,10 +1289,9 @@ class TriggerPost(commands.Cog):
 
     @test_layouts.command(name="layout3")
     async def test_layout3(self, ctx: commands.Context, minutes: Optional[int] = None):
-        data = await self.config.guild(ctx.guild).all()
-        has_link = bool(data.get("rolesource_url"))
+        has_link = bool(self._conf(ctx.guild.id).get("rolesource_url"))
         embed = await self._embed_dashboard(ctx.guild, "overview")
-        view = self.DashboardView(self, with_role_button=has_link)
+        view = self._views["dashboard_role" if has_link else "dashboard"]
         await self._post_or_edit(
             ctx.channel, embed, None, target_id=None, autodelete_after_min=minutes, view=view,
             intro_text=f"{EMOJI_TITLE} Muhhelfer – Dashboard:", cleanup_in_target=False
@@ -620,7 +1300,7 @@ class TriggerPost(commands.Cog):
     @test_layouts.command(name="layout4")
     async def test_layout4(self, ctx: commands.Context, minutes: Optional[int] = None):
         embed = await self._embed_commands(show_admin=False)
-        view = self.CommandsView(self, show_admin=False)
+        view = self._views["commands"]
         await self._post_or_edit(
             ctx.channel, embed, None, target_id=None, autodelete_after_min=minutes, view=view,
             intro_text=f"{EMOJI_TITLE} Muhhelfer – Befehlsübersicht:", cleanup_in_target=False
@@ -655,6 +1335,7 @@ class TriggerPost(commands.Cog):
             "\n"
             "Posten: `°muhhelfer test layout1|layout2|layout3|layout4 [min]`\n"
             "Alle: `°muhhelfer layouts postall [min]`\n"
+            "Dauerhaft (Auto-Refresh): `°muhhelfer targets add #channel main|layout1|layout2|layout3 [message_id]`\n"
         )
         await ctx.send(txt)
 
@@ -663,100 +1344,429 @@ class TriggerPost(commands.Cog):
     async def on_message(self, message: discord.Message):
         if message.author.bot or not message.guild:
             return
+        if message.channel.id not in self._target_channels:
+            return
+        recorder = self._recorders.get(message.guild.id)
+        if recorder is not None:
+            recorder.message(message)
+        await self._on_target_message(message)
+
+    @_timed("on_message")
+    async def _on_target_message(self, message: discord.Message):
         guild = message.guild
-        data = await self.config.guild(guild).all()
+        data = self._conf(guild.id)
         target_id = data["target_channel_id"]
         if not target_id or message.channel.id != target_id:
             return
 
-        content = message.content.casefold()
-        matched = False
-        for trigger in data["triggers"]:
-            if "+" in trigger:
-                parts = [p.strip() for p in trigger.split("+") if p.strip()]
-                if parts and all(p in content for p in parts):
-                    matched = True
-                    break
-            elif trigger in content:
-                matched = True
-                break
-        if not matched:
+        matcher = self._matcher_for(guild.id)
+        if not matcher.matches(message.content.casefold()):
             return
 
-        now = time.time()
-        until = self._cooldown_until.get(message.channel.id, 0)
         author = message.author
         is_admin = author.guild_permissions.administrator or author.guild_permissions.manage_guild
         has_bypass = any(r.id == ROLE_OFFIZIERE_BYPASS for r in author.roles)
         if not (is_admin or has_bypass):
-            cd = data.get("cooldown_seconds", 30)
-            if now < until:
+            if self._cooldowns.hit(("post", message.channel.id), data.get("cooldown_seconds", 30)):
                 return
-            self._cooldown_until[message.channel.id] = now + cd
 
         embed = await self._embed_main(guild, author)
         intro = (f"{data.get('intro_text')}\n\n{EMOJI_TITLE} Muhhelfer – Übersicht:" if data.get("intro_text") else f"{EMOJI_TITLE} Muhhelfer – Übersicht:")
-        view = self.PingView(self)
+        view = self._views["ping"]
         await self._post_or_edit(
             message.channel, embed, data["message_id"], target_id=target_id, view=view,
             intro_text=intro, identifier_for_cleanup="Muhhelfer – Übersicht",
             allow_create_if_missing=True,   # Trigger: darf neu posten
         )
 
-    # ====== Auto-Refresh (editiert nur, erstellt nie neu) ======
-    @tasks.loop(seconds=30)
-    async def _auto_refresher(self):
-        now = time.time()
+    # ====== Listener: Roster-Index ======
+    def _roster_event(self, member: discord.Member):
+        self._member_lines.pop(member.id, None)
+        index = self._rosters.get(member.guild.id)
+        if index is not None and index.tracks(member) and index.update_member(member):
+            self._roster_changed(member.guild.id)
+
+    @commands.Cog.listener()
+    async def on_presence_update(self, before: discord.Member, after: discord.Member):
+        if before.status is after.status:
+            return  # reine Activity-Updates ändern die Liste nicht
+        recorder = self._recorders.get(after.guild.id)
+        if recorder is not None:
+            recorder.presence(after)
+        self._roster_event(after)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles == after.roles and before.display_name == after.display_name:
+            return
+        recorder = self._recorders.get(after.guild.id)
+        if recorder is not None:
+            recorder.member(before, after)
+        index = self._rosters.get(after.guild.id)
+        if index is not None and (index.tracks(before) or index.tracks(after)) and index.update_member(after):
+            self._roster_changed(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        # globaler Namenswechsel kommt nicht als on_member_update (Mitglieder ohne Nick)
+        if before.display_name == after.display_name:
+            return
+        for guild_id, index in list(self._rosters.items()):
+            guild = self.bot.get_guild(guild_id)
+            member = guild.get_member(after.id) if guild else None
+            if member is None or not index.tracks(member):
+                continue
+            recorder = self._recorders.get(guild_id)
+            if recorder is not None:
+                recorder.member(member, member)
+            if index.update_member(member):
+                self._roster_changed(guild_id)
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        if (before.channel is None) == (after.channel is None):
+            return  # nur "in Voice ja/nein" ist für Icon und Sortierung relevant
+        recorder = self._recorders.get(member.guild.id)
+        if recorder is not None:
+            recorder.voice(member, after.channel is not None)
+        self._roster_event(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        recorder = self._recorders.get(member.guild.id)
+        if recorder is not None:
+            recorder.remove(member)
+        self._member_lines.pop(member.id, None)
+        index = self._rosters.get(member.guild.id)
+        if index is not None and index.remove_member(member.id):
+            self._roster_changed(member.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild):
+        self._rosters.pop(guild.id, None)  # nach Reconnect neu aufbauen
+        self._warm.discard(guild.id)
+        self._chunk_pending.discard(guild.id)
+        self._maybe_warm(guild)
+        self._ensure_refresh_scheduled(guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._rosters.pop(guild.id, None)
+        for key in [k for k in self._render_cache if k[0] == guild.id]:
+            del self._render_cache[key]
+        for key in [k for k in self._role_lines if k[0] == guild.id]:
+            del self._role_lines[key]
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self._rosters.clear()
+        self._warm.clear()
+        self._chunk_pending.clear()
         for guild in self.bot.guilds:
-            try:
-                data = await self.config.guild(guild).all()
-                interval = int(data.get("auto_refresh_seconds") or 0)
-                target_id = data.get("target_channel_id")
-                message_id = data.get("message_id")
-                if not interval or not target_id or not message_id:
-                    continue
-
-                last_ts = self._last_refresh_ts.get(guild.id, 0.0)
-                if (now - last_ts) < interval:
-                    continue
-                self._last_refresh_ts[guild.id] = now
-
-                channel = guild.get_channel(target_id)
-                if channel is None:
-                    continue
-
-                # prüfe, ob die Zielnachricht existiert – sonst KEIN neuer Post
-                try:
-                    await channel.fetch_message(int(message_id))
-                except Exception:
-                    # Nachricht existiert nicht -> Auto-Refresh überspringen
-                    continue
+            self._maybe_warm(guild)
+            self._ensure_refresh_scheduled(guild.id)
 
-                sig = self._signature_for_guild(guild)
-                if self._last_signature.get(guild.id) == sig:
-                    continue
+    # ====== Lazy-Modus: Muhhelfer gezielt nachladen ======
+    def _maybe_warm(self, guild: discord.Guild):
+        if guild.chunked or guild.id in self._warm or guild.id in self._warm_tasks:
+            return
+        if not self._conf(guild.id).get("lazy_members"):
+            return
+        self._warm_tasks[guild.id] = asyncio.create_task(self._warm_roster(guild))
 
-                author = guild.me
-                embed = await self._embed_main(guild, author)  # type: ignore
-                view = self.PingView(self)
-                try:
-                    await self._post_or_edit(
-                        channel, embed, message_id,
-                        target_id=target_id, view=view,
-                        intro_text=f"{EMOJI_TITLE} Muhhelfer – Übersicht:",
-                        identifier_for_cleanup="Muhhelfer – Übersicht",
-                        allow_create_if_missing=False,  # <<< WICHTIG: nie neu erstellen
-                    )
-                    self._last_signature[guild.id] = sig
-                except Exception:
-                    # nichts tun – Regel: kein Neupost beim Auto-Refresh
-                    pass
-            except Exception:
+    async def _warm_roster(self, guild: discord.Guild):
+        """Lädt zuerst nur die Muhhelfer aus dem letzten Snapshot (query_members, 100er-Blöcke) und
+        rendert ab dann live. Wer seine Rolle bekommen hat, während der Bot offline war, taucht erst
+        nach dem guild.chunk() im Hintergrund auf; bis dahin wird kein Snapshot geschrieben, damit
+        die unvollständige Inhaberliste nicht auf der Platte landet."""
+        try:
+            snap = self._snapshots.get(guild.id) or {}
+            ids = sorted({int(i) for holders in snap.get("holders", {}).values() for i in holders})
+            if ids:
+                with self._metrics.timer("roster_warm"):
+                    presences = self.bot.intents.presences
+                    for start in range(0, len(ids), 100):
+                        try:
+                            await guild.query_members(user_ids=ids[start:start + 100], limit=100, presences=presences, cache=True)
+                        except asyncio.TimeoutError:
+                            log.warning("query_members-Timeout in Guild %s (Block ab %s)", guild.id, start)
+                self._chunk_pending.add(guild.id)
+                self._warm.add(guild.id)
+                self._rosters.pop(guild.id, None)
+                self._metrics.inc("roster_warmed_total", source="snapshot")
+            if not guild.chunked:
+                with self._metrics.timer("roster_chunk"):
+                    await guild.chunk(cache=True)
+            self._chunk_pending.discard(guild.id)
+            self._warm.add(guild.id)
+            self._rosters.pop(guild.id, None)  # Index mit neu gefundenen Rolleninhabern neu aufbauen
+            self._metrics.inc("roster_warmed_total", source="chunk")
+        except Exception:
+            log.exception("Muhhelfer konnten in Guild %s nicht nachgeladen werden", guild.id)
+        finally:
+            self._warm_tasks.pop(guild.id, None)
+
+    def _make_snapshot(self, guild: discord.Guild) -> dict:
+        holders, lines = {}, {}
+        for role_id in (ROLE_NORMAL, ROLE_SCHWER):
+            role = guild.get_role(role_id)
+            holders[str(role_id)] = [m.id for m in role.members] if role else []
+            lines[str(role_id)] = self._roster_lines(guild, role_id)
+        return {"holders": holders, "lines": lines, "ts": int(time.time())}
+
+    async def _save_snapshots(self):
+        for guild_id, index in list(self._rosters.items()):
+            if not self._conf(guild_id).get("lazy_members") or guild_id in self._chunk_pending:
                 continue
+            sig = (index.serial, index.version)
+            guild = self.bot.get_guild(guild_id)
+            if guild is None or self._snapshot_sigs.get(guild_id) == sig:
+                continue
+            self._snapshots.put(guild_id, self._make_snapshot(guild))
+            self._snapshot_sigs[guild_id] = sig
+        for store in (self._snapshots, self._refresh_state):
+            payload = store.dump()
+            if payload is not None:
+                await asyncio.to_thread(store.write, payload)
+        for recorder in list(self._recorders.values()):
+            await recorder.save()
+
+    async def _snapshot_loop(self):
+        while True:
+            await asyncio.sleep(SNAPSHOT_FLUSH_SECONDS)
+            try:
+                await self._save_snapshots()
+            except Exception:
+                log.exception("Snapshots konnten nicht gespeichert werden")
+
+    # ====== Auto-Refresh (editiert nur, erstellt nie neu) ======
+    def _refresh_interval(self, guild_id: int) -> int:
+        """Intervall in Sekunden; 0, wenn Auto-Refresh aus ist oder kein Ziel gesetzt ist."""
+        data = self._conf(guild_id)
+        has_primary = data.get("target_channel_id") and data.get("message_id")
+        if not has_primary and not data.get("overview_targets"):
+            return 0
+        seconds = int(data.get("auto_refresh_seconds") or 0)
+        bounds = data.get("auto_refresh_adaptive")
+        if seconds and bounds:
+            return adaptive_interval(self._churn_rate(guild_id), *bounds)
+        return seconds
+
+    def _churn_rate(self, guild_id: int) -> float:
+        churn = self._churn.get(guild_id)
+        return churn.rate() if churn else 0.0
+
+    def _roster_changed(self, guild_id: int):
+        """Sichtbare Roster-Änderung: Churn zählen, adaptives Intervall ggf. vorziehen, Push markieren."""
+        churn = self._churn.get(guild_id)
+        if churn is None:
+            churn = self._churn[guild_id] = ChurnRate(clock=self._clock)
+        churn.hit()
+        if self._conf(guild_id).get("auto_refresh_adaptive"):
+            # steigt der Churn, soll der nächste Refresh nicht erst nach dem alten (langen) Intervall kommen
+            interval = self._refresh_interval(guild_id)
+            due = self._refresh_schedule.due_at(guild_id)
+            now = self._refresh_schedule.now()
+            if interval and due is not None and due - now > interval:
+                self._refresh_schedule.schedule(guild_id, now + interval)
+        self._mark_dirty(guild_id)
+
+    def _autorefresh_status(self, guild_id: int) -> str:
+        data = self._conf(guild_id)
+        seconds = int(data.get("auto_refresh_seconds") or 0)
+        bounds = data.get("auto_refresh_adaptive")
+        if not seconds:
+            return "Auto-Refresh: **aus**"
+        if not bounds:
+            return f"Auto-Refresh: **{seconds}s**"
+        rate = self._churn_rate(guild_id)
+        interval = adaptive_interval(rate, *bounds)
+        return (f"Auto-Refresh: **adaptiv {bounds[0]}–{bounds[1]}s**, aktuell **{interval}s** • "
+                f"Churn: {rate * 60:.1f} Änderungen/Min")
+
+    def _reschedule_refresh(self, guild_id: int, *, stagger: bool = False):
+        """Nächsten Termin setzen. Mit stagger liegt der erste Termin an einem festen, pro Guild
+        verschiedenen Punkt im Intervall (gleiche Guild → gleicher Versatz, auch nach Neustart)."""
+        interval = self._refresh_interval(guild_id)
+        if interval:
+            delay = random.Random(guild_id).uniform(0, interval) if stagger else interval
+            self._refresh_schedule.schedule(guild_id, self._refresh_schedule.now() + delay)
+        else:
+            self._refresh_schedule.cancel(guild_id)
+
+    def _ensure_refresh_scheduled(self, guild_id: int):
+        """Guild (wieder) einplanen, falls sie keinen Termin mehr hat – bestehende Termine bleiben."""
+        if guild_id not in self._refresh_schedule:
+            self._reschedule_refresh(guild_id, stagger=True)
 
-    @_auto_refresher.before_loop
-    async def _before_refresher(self):
-        await self.bot.wait_until_ready()
+    async def _auto_refresher(self):
+        """Schläft bis zur nächsten fälligen Guild (Min-Heap) statt alle 30s alle Guilds zu prüfen.
+        Wartet nicht auf wait_until_ready: Guilds, deren Muhhelfer noch nicht geladen sind, werden
+        einzeln übersprungen, statt alle auf das Chunking der größten Guild warten zu lassen.
+        Fällige Guilds laufen als eigene Tasks (max. REFRESH_CONCURRENCY gleichzeitig), damit ein
+        langsamer Edit nicht alle folgenden Guilds aufhält."""
+        # Ein Tick ist rein In-Memory (Heap, Config-Cache, Roster-Index); I/O haben nur fällige Guilds
+        for guild_id in list(self._conf_cache):
+            self._reschedule_refresh(guild_id, stagger=True)
+        while True:
+            for guild_id, due in await self._refresh_schedule.next_due():
+                self._refresh_due(guild_id, due)
+
+    def _refresh_due(self, guild_id: int, due: float):
+        """Fälliger Intervall-Termin: weiterplanen und den Refresh als Task starten."""
+        interval = self._refresh_interval(guild_id)
+        if not interval:
+            return
+        now = self._refresh_schedule.now()
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            # cog_load läuft vor dem Gateway-Connect: Guild noch nicht da → diesen Tick auslassen
+            self._refresh_schedule.schedule(guild_id, max(due + interval, now))
+            self._metrics.inc("refresh_skipped_total", reason="no_guild")
+            return
+        # driftfrei weiterplanen; wer hinterherhängt, startet ab jetzt neu
+        lag = now - due
+        self._metrics.observe("refresher_lag_seconds", lag)
+        self._metrics.set_gauge("refresher_last_lag_seconds", lag)
+        self._refresh_schedule.schedule(guild_id, max(due + interval, now))
+        if self._conf(guild_id).get("auto_refresh_adaptive"):
+            self._metrics.set_gauge("refresh_interval_seconds", interval, guild=guild_id)
+        if guild_id in self._refresh_running:
+            self._metrics.inc("refresh_skipped_total", reason="busy")
+            return
+        self._refresh_running[guild_id] = asyncio.create_task(self._run_refresh(guild))
 
+    async def _run_refresh(self, guild: discord.Guild):
+        try:
+            async with self._refresh_slots:
+                await self._auto_refresh_guild(guild)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._metrics.inc("refresh_errors_total")
+            log.exception("Auto-Refresh für Guild %s fehlgeschlagen", guild.id)
+        finally:
+            self._refresh_running.pop(guild.id, None)
+
+    # ====== Push-Modus (Debouncer über denselben Deadline-Heap) ======
+    def _push_interval(self, guild_id: int) -> int:
+        data = self._conf(guild_id)
+        has_primary = data.get("target_channel_id") and data.get("message_id")
+        if not has_primary and not data.get("overview_targets"):
+            return 0
+        return int(data.get("push_min_interval") or 0)
+
+    def _mark_dirty(self, guild_id: int):
+        """Roster hat sich sichtbar geändert: nach PUSH_QUIET_SECONDS Ruhe editieren, bei Dauerfeuer
+        spätestens min_interval nach der ersten Änderung – nie öfter als alle min_interval."""
+        interval = self._push_interval(guild_id)
+        if not interval:
+            return
+        sched = self._push_schedule
+        now = sched.now()
+        first = self._push_dirty_since.setdefault(guild_id, now)
+        due = max(min(now + PUSH_QUIET_SECONDS, first + interval), self._push_last.get(guild_id, -interval) + interval)
+        current = sched.due_at(guild_id)
+        if current is None or abs(current - due) >= 0.5:  # Heap nicht bei jedem Presence-Event anfassen
+            sched.schedule(guild_id, due)
+
+    async def _push_refresher(self):
+        """Schläft, solange keine Guild markiert ist – in ruhigen Stunden also keinerlei Arbeit."""
+        while True:
+            for guild_id, _due in await self._push_schedule.next_due():
+                self._push_due(guild_id)
+
+    def _push_due(self, guild_id: int):
+        guild = self.bot.get_guild(guild_id)
+        if guild is None or not self._push_interval(guild_id):
+            self._push_dirty_since.pop(guild_id, None)
+            return
+        if guild_id in self._refresh_running:
+            # läuft gerade (Intervall oder Push) → kurz danach nochmal
+            self._push_schedule.schedule(guild_id, self._push_schedule.now() + PUSH_QUIET_SECONDS)
+            return
+        now = self._push_schedule.now()
+        self._metrics.observe("push_delay_seconds", now - self._push_dirty_since.pop(guild_id, now))
+        self._push_last[guild_id] = now
+        self._refresh_running[guild_id] = asyncio.create_task(self._run_refresh(guild))
+
+    def _remember_refresh(self, guild_id: int, body: str):
+        self._last_body[guild_id] = body
+        self._refresh_state.put(guild_id, {"body": body})
+
+    def _forget_refresh(self, guild_id: int):
+        self._last_body.pop(guild_id, None)
+        self._refresh_state.discard(guild_id)
+
+    @_timed("refresh_cycle")
+    async def _auto_refresh_guild(self, guild: discord.Guild):
+        """Hauptübersicht + alle overview_targets der Guild. Roster-Index und Bodies werden einmal
+        berechnet und von allen Zielen geteilt; die Edits laufen parallel (TARGET_CONCURRENCY)."""
+        data = self._conf(guild.id)
+        target_id = data.get("target_channel_id")
+        message_id = data.get("message_id")
+        channel = guild.get_channel(target_id) if target_id and message_id else None
+        extras = []
+        for target in data.get("overview_targets") or []:
+            extra_channel = guild.get_channel(target["channel_id"])
+            if extra_channel is not None and target["message_id"] not in self._dead_overviews:
+                extras.append((extra_channel, target))
+        if channel is None and not extras:
+            self._metrics.inc("refresh_skipped_total", reason="no_channel")
+            return
+        if data.get("lazy_members") and not self._roster_loaded(guild):
+            # Lazy-Modus: Muhhelfer noch nicht geladen; die Nachricht zeigt noch den letzten Stand
+            self._metrics.inc("refresh_skipped_total", reason="warming")
+            return
+        # Zielnachricht war beim letzten Edit weg -> KEIN neuer Post, bis die Config sich ändert
+        primary = channel is not None and guild.id not in self._dead_targets
+        if not primary and not extras:
+            self._metrics.inc("refresh_skipped_total", reason="dead_target")
+            return
 
+        # Hash über die gerenderten Zeilen: erfasst auch reine Icon-Wechsel (Status/Voice)
+        body = self._roster_digest(guild)
+        if self._last_body.get(guild.id) == body:
+            self._metrics.inc("refresh_skipped_total", reason="unchanged")
+            return
+        # jede Nachricht bleibt auf der zuletzt per Button gewählten Seite (und beim Dashboard-Tab);
+        # einmal festgehalten, damit ein Klick während der Renders nicht ins Leere greift
+        author = guild.me
+        keys = {}
+        if primary:
+            keys[message_id] = ("main", self._pages.get(message_id, 1), "overview")
+        for _c, t in extras:
+            mid = t["message_id"]
+            keys[mid] = (t["layout"], self._pages.get(mid, 1), self._tabs.get(mid, "overview"))
+        rendered = {}
+        for key in keys.values():
+            if key not in rendered:
+                layout, page, tab = key
+                rendered[key] = await self._render_layout(guild, layout, author, page, tab)  # type: ignore
+
+        slots = asyncio.Semaphore(TARGET_CONCURRENCY)
+
+        async def edit_primary():
+            intro, embed, view = rendered[keys[message_id]]
+            async with slots:
+                await self._post_or_edit(
+                    channel, embed, message_id,
+                    target_id=target_id, view=view,
+                    intro_text=intro,
+                    cleanup_in_target=False,        # die zu editierende Nachricht nicht wegräumen
+                    allow_create_if_missing=False,  # <<< WICHTIG: nie neu erstellen
+                )
 
+        async def edit_extra(extra_channel, target):
+            async with slots:
+                await self._edit_overview(extra_channel, target["message_id"], *rendered[keys[target["message_id"]]])
+
+        jobs = [edit_primary()] if primary else []
+        jobs += [edit_extra(c, t) for c, t in extras]
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        failed = [r for r in results if isinstance(r, Exception)]
+        for exc in failed:
+            # nichts tun – Regel: kein Neupost beim Auto-Refresh
+            log.debug("Auto-Refresh: Edit in Guild %s übersprungen", guild.id, exc_info=exc)
+        if not failed:
+            self._remember_refresh(guild.id, body)